@@ -193,8 +193,11 @@ DATABASES = {
         'HOST': os.getenv('SQL_HOST', os.getenv('POSTGRES_HOST', 'db')),
         'PORT': os.getenv('SQL_PORT', os.getenv('POSTGRES_PORT', '5432')),
         # ✅ PERFORMANCE: Connection pooling
-        'CONN_MAX_AGE': 600,  # Keep connections alive for 10 minutes
+        'CONN_MAX_AGE': int(os.getenv('SQL_CONN_MAX_AGE') or '600'),  # Keep connections alive for 10 minutes
         'CONN_HEALTH_CHECKS': True,  # Verify connections before reusing
+        # Set to True behind PgBouncer in transaction pooling mode: named
+        # cursors used by QuerySet.iterator() cannot span pooled transactions
+        'DISABLE_SERVER_SIDE_CURSORS': os.getenv('SQL_DISABLE_SERVER_SIDE_CURSORS', 'False') in ('True', '1', 'true', 'yes'),
         # ✅ PERFORMANCE: PostgreSQL specific optimizations
         'OPTIONS': {
             'connect_timeout': 10,
@@ -32,8 +32,9 @@ admin.site.register(User, CustomUserAdmin)
 
 from django import forms
 from django.core.exceptions import ValidationError
-from django.db.models import Count, Q
+from django.db.models import Count, Prefetch, Q
 from collections import Counter
+from operator import attrgetter
 
 from .timezones import timezone_choices
 from django.db import models
@@ -236,17 +237,14 @@ class UserAdmin(BaseUserAdmin):
         if obj.property_id:
             return obj.property_id
         
-        # If User.property_id is empty, try to get it from the related Property
-        if obj.accessible_properties.exists():
-            property_obj = obj.accessible_properties.first()
-            return property_obj.property_id if property_obj else "-"
-        
-        return "-"
+        # If User.property_id is empty, fall back to the first related Property
+        property_obj = next(iter(obj.accessible_properties.all()), None)
+        return property_obj.property_id if property_obj else "-"
     get_property_id_display.short_description = 'Property ID'
     get_property_id_display.admin_order_field = 'property_id'
 
     def get_queryset(self, request):
-        queryset = super().get_queryset(request)
+        queryset = super().get_queryset(request).prefetch_related('accessible_properties')
         # Current month date range
         start_of_month = timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
         # Add enough days to guarantee moving to next month, then reset to day 1
@@ -805,7 +803,8 @@ class MachineAdmin(admin.ModelAdmin):
             'Updated At',
         ])
         
-        for machine in qs:
+        # Stream rows in chunks; prefetches are applied per chunk.
+        for machine in qs.iterator(chunk_size=500):
             writer.writerow([
                 machine.machine_id or '',
                 machine.name or '',
@@ -2540,7 +2539,8 @@ class PropertyAdmin(admin.ModelAdmin):
             'Created At',
         ])
         
-        for prop in qs:
+        # Stream rows in chunks; prefetches are applied per chunk.
+        for prop in qs.iterator(chunk_size=500):
             users = ", ".join([f"{u.username} ({u.email})" for u in prop.users.all()])
             writer.writerow([
                 prop.property_id or '',
@@ -2711,12 +2711,9 @@ class UserProfileAdmin(admin.ModelAdmin):
         if obj.user.property_id:
             return obj.user.property_id
         
-        # If User.property_id is empty, try to get it from the related Property
-        if obj.user.accessible_properties.exists():
-            property_obj = obj.user.accessible_properties.first()
-            return property_obj.property_id if property_obj else "-"
-        
-        return "-"
+        # If User.property_id is empty, fall back to the first related Property
+        property_obj = next(iter(obj.user.accessible_properties.all()), None)
+        return property_obj.property_id if property_obj else "-"
     user_property_id.short_description = 'User Property ID'
     
     def profile_property_name(self, obj):
@@ -2728,20 +2725,24 @@ class UserProfileAdmin(admin.ModelAdmin):
         if obj.property_id:
             return obj.property_id
         
-        # If UserProfile.property_id is empty, try to get it from the related Property
-        if obj.properties.exists():
-            property_obj = obj.properties.first()
-            return property_obj.property_id if property_obj else "-"
-        
-        return "-"
+        # If UserProfile.property_id is empty, fall back to the first related Property
+        property_obj = next(iter(obj.properties.all()), None)
+        return property_obj.property_id if property_obj else "-"
     profile_property_id.short_description = 'Profile Property ID'
 
     def get_properties_display(self, obj):
         """Display properties from the ManyToManyField relationship"""
-        if obj.properties.exists():
-            return ", ".join([f"{prop.property_id} - {prop.name}" for prop in obj.properties.all()])
+        properties = obj.properties.all()
+        if properties:
+            return ", ".join([f"{prop.property_id} - {prop.name}" for prop in properties])
         return "No Properties"
     get_properties_display.short_description = 'Properties (ID - Name)'
+
+    def get_queryset(self, request):
+        # Changelist columns read the user and both property relations per row
+        return super().get_queryset(request).select_related('user').prefetch_related(
+            'properties', 'user__accessible_properties'
+        )
     
     actions = ['export_userprofiles_csv']
     
@@ -3948,7 +3949,6 @@ class InventoryAdmin(admin.ModelAdmin):
     
     def property_link(self, obj):
         if obj.property:
-            from django.urls import reverse
             link = reverse("admin:myappLubd_property_change", args=[obj.property.id])
             return format_html('<a href="{}">{}</a>', link, obj.property.name)
         return "No Property"
@@ -3958,7 +3958,6 @@ class InventoryAdmin(admin.ModelAdmin):
     def room_link(self, obj):
         if obj.room:
             try:
-                from django.urls import reverse
                 # Room model uses room_id as primary key, not id
                 room_pk = obj.room.room_id
                 if room_pk:
@@ -4036,6 +4035,10 @@ class InventoryAdmin(admin.ModelAdmin):
         return format_html_join(', ', '{}', ((link,) for link in links))
     pm_links.short_description = 'Preventive Maintenance'
     
+    # item_id is unique, so the item's own relations are the only place a
+    # match can live; there is nothing to fall back to when they have none.
+    # Both columns pick the latest row from the relations get_queryset
+    # prefetches, so the changelist runs no per-row lookups.
     def last_job_by_user(self, obj):
         """Show the last job that used this inventory item, filtered by current user"""
         if not hasattr(self, '_request_user'):
@@ -4045,7 +4048,11 @@ class InventoryAdmin(admin.ModelAdmin):
         if not user:
             return "N/A"
         
-        user_job = obj.jobs.filter(user=user).order_by('-updated_at').first()
+        user_job = max(
+            (job for job in obj.jobs.all() if job.user_id == user.pk),
+            key=attrgetter('updated_at'),
+            default=None,
+        )
         if user_job:
             link = reverse("admin:myappLubd_job_change", args=[user_job.id])
             job_name = user_job.description[:30] + "..." if len(user_job.description) > 30 else user_job.description
@@ -4057,34 +4064,6 @@ class InventoryAdmin(admin.ModelAdmin):
                 job_name
             )
         
-        from .models import Inventory
-        last_inventory = (
-            Inventory.objects.filter(
-                jobs__user=user,
-                item_id=obj.item_id
-            )
-            .order_by('-updated_at')
-            .prefetch_related('jobs')
-            .first()
-        )
-        
-        if last_inventory:
-            related_job = (
-                last_inventory.jobs.filter(user=user)
-                .order_by('-updated_at')
-                .first()
-            )
-            if related_job:
-                link = reverse("admin:myappLubd_job_change", args=[related_job.id])
-                job_name = related_job.description[:30] + "..." if len(related_job.description) > 30 else related_job.description
-                return format_html(
-                    '<a href="{}" title="{}">{} ({})</a>',
-                    link,
-                    related_job.description,
-                    related_job.job_id,
-                    job_name
-                )
-        
         return "No job"
     last_job_by_user.short_description = 'Last Job (My User)'
     
@@ -4097,10 +4076,14 @@ class InventoryAdmin(admin.ModelAdmin):
         if not user:
             return "N/A"
         
-        pm_qs = obj.preventive_maintenances.filter(
-            Q(assigned_to=user) | Q(created_by=user)
-        ).order_by('-updated_at')
-        pm = pm_qs.first()
+        pm = max(
+            (
+                pm for pm in obj.preventive_maintenances.all()
+                if user.pk in (pm.assigned_to_id, pm.created_by_id)
+            ),
+            key=attrgetter('updated_at'),
+            default=None,
+        )
         if pm:
             link = reverse("admin:myappLubd_preventivemaintenance_change", args=[pm.id])
             pm_title = pm.pmtitle[:30] + "..." if len(pm.pmtitle) > 30 else pm.pmtitle
@@ -4112,40 +4095,6 @@ class InventoryAdmin(admin.ModelAdmin):
                 pm_title
             )
         
-        from .models import Inventory
-        last_inventory = (
-            Inventory.objects.filter(
-                preventive_maintenances__isnull=False,
-                item_id=obj.item_id
-            )
-            .filter(
-                Q(preventive_maintenances__assigned_to=user) |
-                Q(preventive_maintenances__created_by=user)
-            )
-            .order_by('-updated_at')
-            .prefetch_related('preventive_maintenances')
-            .first()
-        )
-        
-        if last_inventory:
-            pm = (
-                last_inventory.preventive_maintenances.filter(
-                    Q(assigned_to=user) | Q(created_by=user)
-                )
-                .order_by('-updated_at')
-                .first()
-            )
-            if pm:
-                link = reverse("admin:myappLubd_preventivemaintenance_change", args=[pm.id])
-                pm_title = pm.pmtitle[:30] + "..." if len(pm.pmtitle) > 30 else pm.pmtitle
-                return format_html(
-                    '<a href="{}" title="{}">{} ({})</a>',
-                    link,
-                    pm.pmtitle,
-                    pm.pm_id,
-                    pm_title
-                )
-        
         return "No PM"
     last_pm_by_user.short_description = 'Last PM (My User)'
     
@@ -4173,11 +4122,7 @@ class InventoryAdmin(admin.ModelAdmin):
             super()
             .get_queryset(request)
             .select_related('property', 'room', 'created_by')
-            .prefetch_related(
-                'jobs__user',
-                'preventive_maintenances__assigned_to',
-                'preventive_maintenances__created_by'
-            )
+            .prefetch_related('jobs', 'preventive_maintenances')
         )
     
     def get_inventory_url(self, obj):
@@ -4307,11 +4252,21 @@ class InventoryAdmin(admin.ModelAdmin):
         from xml.sax.saxutils import escape as xml_escape
 
         # Prefetch related data to avoid N+1 queries
+        # Only each item's latest job and PM are read, so the prefetches are
+        # sliced to one row per item (a window query) instead of loading all.
         qs = queryset.select_related('property', 'room', 'created_by').prefetch_related(
-            'jobs__user',
-            'jobs__updated_by',
-            'preventive_maintenances__assigned_to',
-            'preventive_maintenances__created_by'
+            Prefetch(
+                'jobs',
+                queryset=Job.objects.select_related('user', 'updated_by').order_by('-updated_at')[:1],
+                to_attr='latest_jobs',
+            ),
+            Prefetch(
+                'preventive_maintenances',
+                queryset=PreventiveMaintenance.objects.select_related(
+                    'assigned_to', 'created_by'
+                ).order_by('-updated_at')[:1],
+                to_attr='latest_pms',
+            ),
         ).order_by('item_id')
 
         buffer = BytesIO()
@@ -4542,7 +4497,7 @@ class InventoryAdmin(admin.ModelAdmin):
             last_time = None
             
             # Check jobs - prefer updated_by, fallback to user
-            last_job = item.jobs.order_by('-updated_at').first()
+            last_job = next(iter(item.latest_jobs), None)
             if last_job:
                 job_user = last_job.updated_by or last_job.user
                 if job_user:
@@ -4550,7 +4505,7 @@ class InventoryAdmin(admin.ModelAdmin):
                     last_time = last_job.updated_at
             
             # Check PMs
-            last_pm = item.preventive_maintenances.order_by('-updated_at').first()
+            last_pm = next(iter(item.latest_pms), None)
             if last_pm:
                 pm_user = last_pm.assigned_to or last_pm.created_by
                 if pm_user and (last_time is None or (last_pm.updated_at and last_pm.updated_at > last_time)):
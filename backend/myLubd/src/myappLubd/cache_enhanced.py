@@ -61,6 +61,42 @@ class RedisCacheManager:
         
         return value
     
+    def get_or_set_generation(self, key: str, generation_key: str, callable: Callable, timeout: Optional[int] = None) -> Any:
+        """
+        Get value from cache or set it using the callable. The cached value
+        is stamped with the current ``generation_key`` counter and ignored
+        once the counter moves, so one bump_generation call invalidates every
+        key sharing that counter without knowing the keys
+        """
+        timeout = timeout or self.default_timeout
+        cached = cache.get_many([key, generation_key])
+        generation = cached.get(generation_key)
+        if generation is None:
+            # Start from a fresh value so entries stamped before the counter
+            # was evicted can never match again
+            cache.add(generation_key, time.time_ns(), None)
+            generation = cache.get(generation_key)
+        
+        entry = cached.get(key)
+        if isinstance(entry, dict) and entry.get('generation') == generation:
+            logger.debug(f"Cache hit for key: {key}")
+            return entry['value']
+        
+        value = callable()
+        cache.set(key, {'generation': generation, 'value': value}, timeout)
+        logger.debug(f"Cached value for key: {key} at generation {generation}")
+        return value
+    
+    def bump_generation(self, generation_key: str):
+        """
+        Invalidate every value cached under ``generation_key``
+        """
+        try:
+            cache.incr(generation_key)
+        except ValueError:
+            # No counter yet, so nothing was stamped with one
+            pass
+    
     def invalidate_by_tags(self, tags: List[str]):
         """
         Invalidate cache entries by tags
@@ -178,11 +214,36 @@ class CacheDecorator:
         return decorator
 
 
+# Generation counters shared by every user_machines:{user_id} and
+# user_properties:{user_id} entry
+USER_MACHINES_GENERATION = "generation:user_machines"
+USER_PROPERTIES_GENERATION = "generation:user_properties"
+
+
 class CacheInvalidation:
     """
     Smart cache invalidation strategies
     """
     
+    @staticmethod
+    def _delete(patterns: List[str]):
+        """
+        Delete the given keys in one delete_many round-trip; wildcard
+        patterns go through delete_pattern where the backend provides it
+        """
+        delete_pattern = getattr(cache, 'delete_pattern', None)
+        keys = []
+        for pattern in patterns:
+            if delete_pattern and '*' in pattern:
+                delete_pattern(pattern)
+                logger.info(f"Invalidated cache pattern: {pattern}")
+            else:
+                keys.append(pattern)
+        
+        if keys:
+            cache.delete_many(keys)
+            logger.debug(f"Deleted cache keys: {keys}")
+    
     @staticmethod
     def invalidate_user_related_cache(user_id: int):
         """
@@ -191,18 +252,13 @@ class CacheInvalidation:
         patterns = [
             f"user:{user_id}:*",
             f"user_properties:{user_id}",
+            f"user_machines:{user_id}",
             f"user_jobs:{user_id}",
             f"user_stats:{user_id}",
             f"user_profile:{user_id}"
         ]
         
-        for pattern in patterns:
-            try:
-                cache.delete_pattern(pattern)
-                logger.info(f"Invalidated cache pattern: {pattern}")
-            except AttributeError:
-                cache.delete(pattern)
-                logger.debug(f"Deleted cache key: {pattern}")
+        CacheInvalidation._delete(patterns)
     
     @staticmethod
     def invalidate_property_related_cache(property_id: str):
@@ -213,16 +269,14 @@ class CacheInvalidation:
             f"property:{property_id}:*",
             f"property_rooms:{property_id}",
             f"property_jobs:{property_id}",
-            f"property_stats:{property_id}"
+            f"property_stats:{property_id}",
         ]
         
-        for pattern in patterns:
-            try:
-                cache.delete_pattern(pattern)
-                logger.info(f"Invalidated cache pattern: {pattern}")
-            except AttributeError:
-                cache.delete(pattern)
-                logger.debug(f"Deleted cache key: {pattern}")
+        CacheInvalidation._delete(patterns)
+        # Machine and property lists are cached per user, and any user of
+        # the property (or staff) may have this property in theirs
+        cache_manager.bump_generation(USER_MACHINES_GENERATION)
+        cache_manager.bump_generation(USER_PROPERTIES_GENERATION)
     
     @staticmethod
     def invalidate_job_related_cache(job_id: str = None, user_id: int = None):
@@ -237,13 +291,7 @@ class CacheInvalidation:
         if user_id:
             patterns.extend([f'user:{user_id}:jobs', f'user:{user_id}:stats'])
         
-        for pattern in patterns:
-            try:
-                cache.delete_pattern(pattern)
-                logger.info(f"Invalidated cache pattern: {pattern}")
-            except AttributeError:
-                cache.delete(pattern)
-                logger.debug(f"Deleted cache key: {pattern}")
+        CacheInvalidation._delete(patterns)
 
 
 class CacheWarming:
@@ -8,7 +8,7 @@ from django.core.cache import cache
 from typing import Dict, Any, List, Optional
 import logging
 
-from .models import Job, PreventiveMaintenance, Property
+from .models import Job, Machine, PreventiveMaintenance, Property
 
 logger = logging.getLogger(__name__)
 
@@ -42,12 +42,17 @@ class QueryOptimizer:
         """
         Get optimized queryset for PreventiveMaintenance model
         """
+        # Covers what PreventiveMaintenanceListSerializer reads per row
+        # (users with their profiles, the procedure template) so the
+        # notification lists render without per-row lookups.
         return PreventiveMaintenance.objects.select_related(
             'job',
-            'created_by'
+            'created_by__userprofile',
+            'assigned_to__userprofile',
+            'procedure_template'
         ).prefetch_related(
             'topics',
-            'machines__property',
+            Prefetch('machines', queryset=Machine.objects.select_related('property')),
             'job__rooms__properties'
         ).annotate(
             # Add computed fields
@@ -15,20 +15,52 @@ User = get_user_model()
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError, FieldDoesNotExist
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Prefetch, Q, prefetch_related_objects
+from django.db.models.manager import BaseManager
 from django.db.utils import ProgrammingError
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.encoding import iri_to_uri
 from django.core.validators import FileExtensionValidator
 from django.conf import settings
+from collections import defaultdict
+from functools import cached_property
+from operator import attrgetter
 from datetime import timedelta
+from dateutil.relativedelta import relativedelta
 from pathlib import Path
-import math
 
 from .timezones import is_valid_timezone
 
 
 RAW_AUTH_PREFIXES = ('google-oauth2_', 'auth0_', 'auth0|')
 
+# Interval to the next occurrence for each PreventiveMaintenance frequency
+# ('custom' is driven by custom_days and handled by callers).
+PM_FREQUENCY_DELTAS = {
+    'daily': relativedelta(days=1),
+    'weekly': relativedelta(weeks=1),
+    'monthly': relativedelta(months=1),
+    'quarterly': relativedelta(months=3),
+    'semi_annual': relativedelta(months=6),
+    'annual': relativedelta(years=1),
+}
+
+# Shared by the PM before/after image fields. DRF skips validators for
+# empty/None values, and ImageField itself opens the upload with Pillow, so
+# this only guards the filename.
+PM_IMAGE_EXTENSION_VALIDATOR = FileExtensionValidator(allowed_extensions=('jpg', 'jpeg', 'png'))
+
+
+def _pm_schedule_delta(frequency, custom_days=None):
+    """Offset from "now" to the next PM for ``frequency``.
+
+    ``custom`` uses ``custom_days``; unknown frequencies fall back to monthly.
+    """
+    if frequency == 'custom' and custom_days:
+        return relativedelta(days=custom_days)
+    return PM_FREQUENCY_DELTAS.get(frequency, PM_FREQUENCY_DELTAS['monthly'])
+
 
 def is_raw_auth_identifier(value):
     if value is None:
@@ -76,8 +108,100 @@ def get_user_public_username(user, fallback=''):
     return '' if display_name == 'Unknown Technician' and not fallback else display_name
 
 
+def _now(context):
+    """Return a single ``timezone.now()`` per serialization pass.
+
+    Nested and ``many=True`` serializers share the root context, so caching
+    the value there avoids a fresh datetime per row while staying fresh
+    across requests.
+    """
+    now = context.get('_now')
+    if now is None:
+        now = timezone.now()
+        context['_now'] = now
+    return now
+
+
+def _to_aware(value):
+    """Return ``value`` (datetime or ISO string) as an aware datetime, or None.
+
+    Blank or unparseable strings come back as None; naive datetimes are made
+    aware in the current timezone. Already-aware datetimes, which is what
+    DRF's DateTimeField and the database hand back with USE_TZ, return as-is.
+    """
+    if isinstance(value, str):
+        value = parse_datetime(value) if value.strip() else None
+    if value is None or value.utcoffset() is not None:
+        return value
+    return timezone.make_aware(value)
+
+
+def _absolute_uri(context, path):
+    """``request.build_absolute_uri(path)`` with the scheme/host prefix cached.
+
+    ``build_absolute_uri`` re-resolves the host and re-parses the URL on every
+    call; list rows only need the same ``scheme://host`` glued onto an
+    already-quoted storage path. Paths that are not site-absolute (e.g. remote
+    storage URLs) still go through ``build_absolute_uri``.
+    """
+    request = context['request']
+    if not path.startswith('/') or path.startswith('//'):
+        return request.build_absolute_uri(path)
+    prefix = context.get('_url_prefix')
+    if prefix is None:
+        prefix = request.build_absolute_uri('/').rstrip('/')
+        context['_url_prefix'] = prefix
+    return f'{prefix}{path}'
+
+
+def _request_user(context):
+    """The authenticated requesting user, resolved once per serialization pass.
+
+    List getters that filter on the current user would otherwise re-read
+    ``context['request'].user`` for every row. Anonymous users resolve to
+    ``None``; their ``pk`` is ``None`` and would match unowned rows.
+    """
+    if '_request_user' not in context:
+        user = getattr(context.get('request'), 'user', None)
+        context['_request_user'] = user if user is not None and user.is_authenticated else None
+    return context['_request_user']
+
+
+def _ceil_days(delta):
+    """``math.ceil(delta.total_seconds() / 86400)`` without float division.
+
+    timedelta keeps ``seconds``/``microseconds`` non-negative, so any
+    remainder rounds ``days`` up for both future and past deltas.
+    """
+    return delta.days + (1 if delta.seconds or delta.microseconds else 0)
+
+
+class SerializerCacheMixin:
+    """Serialize each (serializer class, pk) at most once per request.
+
+    List responses repeat the same nested users and topics many times. The
+    representation is memoized on the shared root context, so the cache
+    lives exactly as long as one serialization pass. Only valid on flat
+    leaf serializers (``UserSummarySerializer``, ``TopicSerializer``) whose
+    output holds scalars: each hit returns a shallow copy, which is then
+    enough to keep callers from mutating the cached entry.
+    """
+
+    def to_representation(self, instance):
+        pk = getattr(instance, 'pk', None)
+        if pk is None:
+            return super().to_representation(instance)
+        cache = self.context.setdefault('_representation_cache', {})
+        key = (type(self), pk)
+        data = cache.get(key)
+        if data is None:
+            data = super().to_representation(instance)
+            cache[key] = data
+        return dict(data)
+
+
 # User serializer for basic user data
-class UserSerializer(serializers.HyperlinkedModelSerializer):
+class UserPublicSerializer(serializers.HyperlinkedModelSerializer):
     username = serializers.SerializerMethodField()
     display_name = serializers.SerializerMethodField()
 
@@ -91,7 +215,7 @@ class UserSerializer(serializers.HyperlinkedModelSerializer):
     def get_username(self, obj):
         return get_user_public_username(obj)
 
-class UserSummarySerializer(serializers.ModelSerializer):
+class UserSummarySerializer(SerializerCacheMixin, serializers.ModelSerializer):
     username = serializers.SerializerMethodField()
     full_name = serializers.SerializerMethodField()
     display_name = serializers.SerializerMethodField()
@@ -285,8 +409,23 @@ class PropertySerializer(serializers.ModelSerializer):
         include_rooms = self.context.get('include_rooms', False)
         if not include_rooms:
             return []
-        rooms = obj.rooms.all()
-        return RoomSummarySerializer(rooms, many=True, context=self.context).data
+        # Build the RoomSummarySerializer shape from two flat queries instead
+        # of instantiating Room models and a nested serializer per room.
+        rooms = list(obj.rooms.values('room_id', 'name', 'room_type'))
+        if not rooms:
+            return []
+        room_properties = defaultdict(list)
+        links = Room.properties.through.objects.filter(
+            room_id__in=[room['room_id'] for room in rooms]
+        ).order_by('property__name').values_list('room_id', 'property__property_id')
+        for room_id, property_id in links:
+            if property_id:
+                room_properties[room_id].append(property_id)
+        for room in rooms:
+            room['name'] = room['name'] or 'Unnamed room'
+            room['room_type'] = room['room_type'] or 'Room'
+            room['properties'] = room_properties.get(room['room_id'], [])
+        return rooms
     
     def get_is_preventivemaintenance(self, obj):
         """
@@ -347,12 +486,13 @@ class UserProfileSerializer(serializers.ModelSerializer):
     def get_username(self, obj):
         return get_user_public_username(obj.user)
 
-def _build_media_absolute_uri(request, media_path):
+def _build_media_absolute_uri(context, media_path):
     """Build a stable media URL from paths stored by FileField or helper fields.
 
     Admin-created records and older conversion jobs can store a mix of values:
     FileField names, /media/ URLs, absolute backend URLs, or absolute filesystem
-    paths. Normalize those values before exposing them to the frontend.
+    paths. Normalize those values before exposing them to the frontend. The
+    scheme/host prefix comes from ``_absolute_uri``'s per-context cache.
     """
     if not media_path:
         return None
@@ -380,14 +520,174 @@ def _build_media_absolute_uri(request, media_path):
     value = value.lstrip('/\\')
 
     url_path = f'{media_url}{value}'
-    if request:
+    if context and context.get('request'):
         try:
-            return request.build_absolute_uri(url_path)
+            return _absolute_uri(context, iri_to_uri(url_path))
         except Exception:
             return url_path
     return url_path
 
 
+def _pm_property_map(pm_pks):
+    """Map PM pk -> property_id for many PMs with one through-table query."""
+    through = PreventiveMaintenance.machines.through
+    pairs = through.objects.filter(
+        preventivemaintenance_id__in=pm_pks
+    ).values_list('preventivemaintenance_id', 'machine__property__property_id')
+    property_map = {}
+    for pm_pk, property_id in pairs:
+        property_map.setdefault(pm_pk, property_id)
+    return property_map
+
+
+def _machines_prefetched(pm):
+    return 'machines' in getattr(pm, '_prefetched_objects_cache', {})
+
+
+def _get_pm_property_id(pm, property_map=None):
+    """Return the property_id shared by a PM's machines, or None.
+
+    All machines on a PM must belong to the same property, so the first one
+    is enough. Reads ``machines.all()`` so a view-level
+    ``Prefetch('machines', queryset=Machine.objects.select_related('property'))``
+    answers this without any extra query; rows rendered without that
+    prefetch are looked up in ``property_map`` (see
+    ``PMPropertyMapListSerializer``) when one is given.
+    """
+    if property_map is not None and not _machines_prefetched(pm):
+        return property_map.get(pm.pk)
+    machines = list(pm.machines.all())
+    if machines:
+        return machines[0].property.property_id
+    return None
+
+
+def _resolve_machine_ids(machine_ids):
+    """Validate machine_ids in one query; return ``(machine_pks, error)``.
+
+    Fetches ``(pk, machine_id, property FK)`` tuples in a single SELECT with
+    no join and no Machine instances; same-property is checked on the FK
+    column itself. Duplicate ids in the input are ignored. ``validate()``
+    keeps the pks in the validated data so create/update can hand them to
+    ``.set()`` without querying again.
+    """
+    unique_ids = set(machine_ids)
+    rows = list(
+        Machine.objects.filter(machine_id__in=unique_ids)
+        .values_list('pk', 'machine_id', 'property_id')
+    )
+    if unique_ids - {machine_id for _, machine_id, _ in rows}:
+        return None, "One or more machine_ids are invalid."
+    if len({property_id for _, _, property_id in rows}) > 1:
+        return None, "All machines must belong to the same property."
+    return [pk for pk, _, _ in rows], None
+
+
+def _machine_pks(machine_pks, machine_ids):
+    """Machine pks for ``machine_ids``, reusing the ones found in validate()."""
+    if machine_pks is None:
+        machine_pks = list(Machine.objects.filter(machine_id__in=machine_ids).values_list('pk', flat=True))
+    return machine_pks
+
+
+def _link_new(manager, pks):
+    """Link a freshly created instance to ``pks`` with bulk through-table INSERTs.
+
+    A new row has no existing links, so the diff SELECT ``.set()`` runs first
+    is pure overhead. Nothing listens to ``m2m_changed`` for these relations.
+    """
+    through = manager.through
+    source = f'{manager.source_field_name}_id'
+    target = f'{manager.target_field_name}_id'
+    through.objects.bulk_create(
+        [through(**{source: manager.instance.pk, target: pk}) for pk in dict.fromkeys(pks)],
+        batch_size=500,
+        ignore_conflicts=True,
+    )
+
+
+class MediaURLField(serializers.ReadOnlyField):
+    """Read-only URL for a File/ImageField, absolute when a request is known.
+
+    A plain field rather than a SerializerMethodField, so list rows skip the
+    per-field ``get_<name>`` dispatch.
+    """
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        request = self.context.get('request')
+        if request:
+            return _absolute_uri(self.context, value.url)
+        return value.url
+
+
+class PrefetchingSerializerMixin:
+    """Declare the relations a serializer reads so views can eager-load them.
+
+    Keeping ``select_related``/``prefetch_related`` next to the nested fields
+    that need them means a view calls ``setup_eager_loading(queryset)``
+    instead of maintaining its own, easily stale, copy of the list.
+    """
+
+    select_related = ()
+    prefetch_related = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        if cls.select_related:
+            queryset = queryset.select_related(*cls.select_related)
+        if cls.prefetch_related:
+            queryset = queryset.prefetch_related(*cls.prefetch_related)
+        return queryset
+
+    @classmethod
+    def prefetch_instances(cls, instances):
+        """Bulk-load ``prefetch_related`` onto already fetched or saved instances."""
+        if cls.prefetch_related:
+            prefetch_related_objects(instances, *cls.prefetch_related)
+
+
+# Machines with their property joined in, so serializers read
+# machine.property.property_id from the prefetch cache
+PREFETCH_MACHINES_WITH_PROPERTY = Prefetch('machines', queryset=Machine.objects.select_related('property'))
+
+
+class IdListField(serializers.ListField):
+    """ListField of ids that also accepts a single bare id and drops blanks.
+
+    FormData clients send one selected id as a plain string and unset
+    selects as ``""``; coercing here lets ``create``/``update`` use
+    ``validated_data`` as-is.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, (str, int)):
+            data = [data]
+        if isinstance(data, (list, tuple)):
+            data = [item for item in data if item is not None and str(item).strip() != '']
+        return super().to_internal_value(data)
+
+
+class CachedUserPKField(serializers.PrimaryKeyRelatedField):
+    """User ``PrimaryKeyRelatedField`` that resolves each pk once per context.
+
+    The lookup is memoized on the serializer context, so ``many=True`` writes
+    assigning the same user to many rows issue one SELECT, not one per row.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('queryset', User.objects.all())
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        cache = self.context.setdefault('_user_pk_cache', {})
+        key = str(data)
+        if key not in cache:
+            cache[key] = super().to_internal_value(data)
+        return cache[key]
+
+
 # Job image serializer
 class JobImageSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
@@ -400,8 +700,7 @@ class JobImageSerializer(serializers.ModelSerializer):
     def get_image_url(self, obj):
         """Return the URL for the original uploaded image."""
         if obj.image:
-            request = self.context.get('request')
-            return _build_media_absolute_uri(request, getattr(obj.image, 'url', obj.image.name))
+            return _build_media_absolute_uri(self.context, getattr(obj.image, 'url', obj.image.name))
         return None
 
     def get_jpeg_url(self, obj):
@@ -422,11 +721,10 @@ class JobImageSerializer(serializers.ModelSerializer):
             except Exception:
                 pass
 
-        request = self.context.get('request')
-        return _build_media_absolute_uri(request, jp)
+        return _build_media_absolute_uri(self.context, jp)
 
 # Topic serializer
-class TopicSerializer(serializers.ModelSerializer):
+class TopicSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     class Meta:
         model = Topic
         fields = ['title', 'description', 'id', 'is_visible_in_create_job']
@@ -567,14 +865,12 @@ class JobSerializer(serializers.ModelSerializer):
 
     def validate(self, data):
         """Validate timestamp fields to ensure logical order"""
-        from django.utils import timezone
-        
         created_at = data.get('created_at')
         updated_at = data.get('updated_at')
         completed_at = data.get('completed_at')
         
         # If created_at is provided, ensure it's not in the future
-        if created_at and created_at > timezone.now():
+        if created_at and created_at > _now(self.context):
             raise serializers.ValidationError("Created date cannot be in the future")
         
         # If completed_at is provided, ensure it's not before created_at
@@ -666,7 +962,7 @@ class JobSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         image_url = None
         if userprofile.profile_image and request:
-            image_url = request.build_absolute_uri(userprofile.profile_image.url)
+            image_url = _absolute_uri(self.context, userprofile.profile_image.url)
         elif userprofile.profile_image:
             image_url = userprofile.profile_image.url
 
@@ -680,7 +976,6 @@ class JobSerializer(serializers.ModelSerializer):
 
     def get_image_urls(self, obj):
         """Return normalized URLs for all images associated with the job."""
-        request = self.context.get('request')
         urls = []
         seen = set()
         try:
@@ -689,7 +984,7 @@ class JobSerializer(serializers.ModelSerializer):
                 if getattr(image, 'image', None):
                     candidates.append(getattr(image.image, 'url', image.image.name))
                 for candidate in candidates:
-                    url = _build_media_absolute_uri(request, candidate)
+                    url = _build_media_absolute_uri(self.context, candidate)
                     if url and url not in seen:
                         urls.append(url)
                         seen.add(url)
@@ -774,7 +1069,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         return User.objects.create_user(**validated_data)
 
 # User serializer for creation
-class UserSerializer(serializers.ModelSerializer):
+class UserCreateSerializer(serializers.ModelSerializer):
     password = serializers.CharField(
         write_only=True,
         required=True,
@@ -790,11 +1085,24 @@ class UserSerializer(serializers.ModelSerializer):
 
     def validate(self, attrs):
         username = attrs.get('username')
-        if username and User.objects.filter(username=username).exclude(pk=getattr(self.instance, 'pk', None)).exists():
-            raise serializers.ValidationError({"username": "A user with that username already exists."})
-
         email = attrs.get('email')
-        if email and User.objects.filter(email=email).exclude(pk=getattr(self.instance, 'pk', None)).exists():
+        lookup = Q()
+        if username:
+            lookup |= Q(username=username)
+        if email:
+            lookup |= Q(email=email)
+        if not lookup:
+            return attrs
+
+        # Single round-trip for both uniqueness checks
+        conflicts = list(
+            User.objects.filter(lookup)
+            .exclude(pk=getattr(self.instance, 'pk', None))
+            .values_list('username', 'email')
+        )
+        if username and any(existing == username for existing, _ in conflicts):
+            raise serializers.ValidationError({"username": "A user with that username already exists."})
+        if email and any(existing == email for _, existing in conflicts):
             raise serializers.ValidationError({"email": "A user with that email already exists."})
 
         return attrs
@@ -880,7 +1188,7 @@ class MachineSerializer(serializers.ModelSerializer):
         """Get the absolute URL for the machine image"""
         request = self.context.get('request')
         if obj.image and request:
-            return request.build_absolute_uri(obj.image.url)
+            return _absolute_uri(self.context, obj.image.url)
         elif obj.image:
             return obj.image.url
         return None
@@ -935,11 +1243,14 @@ class MachineListSerializer(serializers.ModelSerializer):
         """Get the absolute URL for the machine image"""
         request = self.context.get('request')
         if obj.image and request:
-            return request.build_absolute_uri(obj.image.url)
+            return _absolute_uri(self.context, obj.image.url)
         elif obj.image:
             return obj.image.url
         return None
-class PreventiveMaintenanceListSerializer(serializers.ModelSerializer):
+class PreventiveMaintenanceListSerializer(PrefetchingSerializerMixin, serializers.ModelSerializer):
+    select_related = ('job', 'created_by__userprofile', 'assigned_to__userprofile', 'procedure_template')
+    prefetch_related = ('topics', PREFETCH_MACHINES_WITH_PROPERTY, 'job__rooms__properties')
+
     job_id = serializers.SerializerMethodField()
     job_description = serializers.SerializerMethodField()
     topics = TopicSerializer(many=True)
@@ -983,26 +1294,32 @@ class PreventiveMaintenanceListSerializer(serializers.ModelSerializer):
     def get_job_description(self, obj):
         return obj.job.description if obj.job else None
 
+    @cached_property
+    def _machine_serializer(self):
+        # One instance per list pass: building a ModelSerializer per row
+        # deep-copies and rebuilds its whole field tree every time
+        return MachineSerializer()
+
+    # machines/topics/job.rooms.properties are read through .all() so the
+    # view's prefetch_related covers every row instead of querying per PM.
     def get_machines(self, obj):
-        return MachineSerializer(obj.machines.all(), many=True).data if obj.machines.exists() else []
+        return [self._machine_serializer.to_representation(machine) for machine in obj.machines.all()]
 
     def get_property_id(self, obj):
         # Prefer properties via job -> rooms
-        if obj.job and obj.job.rooms.exists():
-            properties = Property.objects.filter(rooms__job=obj.job).distinct()
-            return [prop.property_id for prop in properties]
+        rooms = obj.job.rooms.all() if obj.job else ()
+        properties = {prop.pk: prop for room in rooms for prop in room.properties.all()}
 
         # Fallback: infer from machines' property
-        if obj.machines.exists():
-            machine_props = Property.objects.filter(machines__in=obj.machines.all()).distinct()
-            return [prop.property_id for prop in machine_props]
+        if not rooms:
+            properties = {machine.property.pk: machine.property for machine in obj.machines.all()}
 
-        return []
+        return [prop.property_id for prop in sorted(properties.values(), key=lambda prop: prop.name)]
 
     def get_status(self, obj):
         if obj.completed_date:
             return 'completed'
-        if obj.scheduled_date and obj.scheduled_date < timezone.now():
+        if obj.scheduled_date and obj.scheduled_date < _now(self.context):
             return 'overdue'
         return 'pending'
 
@@ -1012,13 +1329,13 @@ class PreventiveMaintenanceListSerializer(serializers.ModelSerializer):
     def get_before_image_url(self, obj):
         request = self.context.get('request')
         if obj.before_image and request:
-            return request.build_absolute_uri(obj.before_image.url)
+            return _absolute_uri(self.context, obj.before_image.url)
         return None
 
     def get_after_image_url(self, obj):
         request = self.context.get('request')
         if obj.after_image and request:
-            return request.build_absolute_uri(obj.after_image.url)
+            return _absolute_uri(self.context, obj.after_image.url)
         return None
 
 class MachineDetailSerializer(serializers.ModelSerializer):
@@ -1058,7 +1375,7 @@ class MachineDetailSerializer(serializers.ModelSerializer):
         """Get the absolute URL for the machine image"""
         request = self.context.get('request')
         if obj.image and request:
-            return request.build_absolute_uri(obj.image.url)
+            return _absolute_uri(self.context, obj.image.url)
         elif obj.image:
             return obj.image.url
         return None
@@ -1099,16 +1416,14 @@ class MachineDetailSerializer(serializers.ModelSerializer):
             # Handle case where migration hasn't been applied yet (table doesn't exist)
             # ProgrammingError: relation "myappLubd_maintenanceprocedure_machines" does not exist
             # Log the error but don't crash the API
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Could not fetch maintenance_procedures for machine {obj.id}: {e}. "
-                          f"Migration 0038 may not have been applied yet.")
+            logger.warning("Could not fetch maintenance_procedures for machine %s: %s. "
+                           "Migration 0038 may not have been applied yet.", obj.id, e)
             return []
     
     def get_days_since_last_maintenance(self, obj):
         """Calculate days since last maintenance"""
         if obj.last_maintenance_date:
-            delta = timezone.now() - obj.last_maintenance_date
+            delta = _now(self.context) - obj.last_maintenance_date
             return delta.days
         return None
     
@@ -1194,45 +1509,52 @@ class MachinePreventiveMaintenanceSerializer(serializers.ModelSerializer):
         pm_ids = validated_data.pop('preventive_maintenance_ids', [])
         
         if pm_ids:
-            pm_instances = PreventiveMaintenance.objects.filter(pm_id__in=pm_ids)
-            
-            if pm_instances.count() < len(pm_ids):
-                missing_ids = set(pm_ids) - set(pm_instances.values_list('pm_id', flat=True))
+            # One query resolves both the existence check and the pks for .set()
+            found = dict(
+                PreventiveMaintenance.objects.filter(pm_id__in=pm_ids).values_list('pm_id', 'id')
+            )
+            missing_ids = set(pm_ids) - set(found)
+            if missing_ids:
                 raise serializers.ValidationError({
-                    'preventive_maintenance_ids': f'Invalid maintenance IDs: {", ".join(missing_ids)}'
+                    'preventive_maintenance_ids': f'Invalid maintenance IDs: {", ".join(sorted(missing_ids))}'
                 })
-            
-            instance.preventive_maintenances.set(pm_instances)
-            
-            latest_completed = pm_instances.filter(
+
+            pm_pks = list(found.values())
+            instance.preventive_maintenances.set(pm_pks)
+
+            latest_completed = PreventiveMaintenance.objects.filter(
+                id__in=pm_pks,
                 completed_date__isnull=False
-            ).order_by('-completed_date').first()
+            ).order_by('-completed_date').values_list('completed_date', flat=True).first()
             
             if latest_completed:
-                instance.last_maintenance_date = latest_completed.completed_date
+                instance.last_maintenance_date = latest_completed
                 instance.save(update_fields=['last_maintenance_date', 'updated_at'])
         return instance
 
 # ----- Preventive Maintenance Serializers -----
 
 
-class PreventiveMaintenanceDetailSerializer(serializers.ModelSerializer):
+class PreventiveMaintenanceDetailSerializer(PrefetchingSerializerMixin, serializers.ModelSerializer):
     """Detailed serializer for single item view, creation and updates"""
-    pmtitle = serializers.SerializerMethodField()
-    before_image_url = serializers.SerializerMethodField()
-    after_image_url = serializers.SerializerMethodField()
+    select_related = ('created_by__userprofile', 'assigned_to__userprofile', 'procedure_template')
+    prefetch_related = ('topics', PREFETCH_MACHINES_WITH_PROPERTY)
+
+    pmtitle = serializers.CharField(read_only=True)
+    before_image_url = MediaURLField(source='before_image')
+    after_image_url = MediaURLField(source='after_image')
     is_overdue = serializers.SerializerMethodField()
-    created_by = UserSerializer(read_only=True)
+    created_by = UserCreateSerializer(read_only=True)
     days_remaining = serializers.SerializerMethodField()
     topics = TopicSerializer(many=True, read_only=True)
-    topic_ids = serializers.ListField(
+    topic_ids = IdListField(
         child=serializers.IntegerField(),
         write_only=True,
         required=False,
         allow_empty=True
     )
     machines = MachineSerializer(many=True, read_only=True)
-    machine_ids = serializers.ListField(
+    machine_ids = IdListField(
         child=serializers.CharField(),
         write_only=True,
         required=False,
@@ -1241,11 +1563,7 @@ class PreventiveMaintenanceDetailSerializer(serializers.ModelSerializer):
     property_id = serializers.SerializerMethodField()
     procedure_template_name = serializers.CharField(source='procedure_template.name', read_only=True)
     procedure_template_id = serializers.IntegerField(source='procedure_template.id', read_only=True)
-    assigned_to = serializers.PrimaryKeyRelatedField(
-        queryset=User.objects.all(),
-        required=False,
-        allow_null=True
-    )
+    assigned_to = CachedUserPKField(required=False, allow_null=True)
     assigned_to_details = UserSummarySerializer(source='assigned_to', read_only=True)
     created_by_details = UserSummarySerializer(source='created_by', read_only=True)
     assigned_to_name = serializers.SerializerMethodField()
@@ -1255,12 +1573,12 @@ class PreventiveMaintenanceDetailSerializer(serializers.ModelSerializer):
     before_image = serializers.ImageField(
         required=False,
         allow_null=True,
-        validators=[FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png'])]
+        validators=[PM_IMAGE_EXTENSION_VALIDATOR]
     )
     after_image = serializers.ImageField(
         required=False,
         allow_null=True,
-        validators=[FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png'])]
+        validators=[PM_IMAGE_EXTENSION_VALIDATOR]
     )
     
     class Meta:
@@ -1291,9 +1609,6 @@ class PreventiveMaintenanceDetailSerializer(serializers.ModelSerializer):
             'next_due_date': {'required': False},
         }
     
-    def get_pmtitle(self, obj):
-        return obj.pmtitle
-
     def get_assigned_to_name(self, obj):
         return get_user_display_name(obj.assigned_to)
 
@@ -1303,82 +1618,44 @@ class PreventiveMaintenanceDetailSerializer(serializers.ModelSerializer):
     def get_created_by_name(self, obj):
         return get_user_display_name(obj.created_by)
     
-    def get_before_image_url(self, obj):
-        """Get the full URL for the before image"""
-        if obj.before_image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.before_image.url)
-            return obj.before_image.url
-        return None
-    
-    def get_after_image_url(self, obj):
-        """Get the full URL for the after image"""
-        if obj.after_image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.after_image.url)
-            return obj.after_image.url
-        return None
-    
     def get_is_overdue(self, obj):
         """Check if maintenance is overdue"""
-        if not obj.completed_date and obj.scheduled_date < timezone.now():
+        if not obj.completed_date and obj.scheduled_date < _now(self.context):
             return True
         return False
     
     def get_days_remaining(self, obj):
         """Calculate days remaining until scheduled date or next due date"""
-        now = timezone.now()
+        now = _now(self.context)
         
         if obj.completed_date:
             if obj.next_due_date:
-                delta = obj.next_due_date - now
-                return math.ceil(delta.total_seconds() / 86400)
+                return _ceil_days(obj.next_due_date - now)
             return None
         else:
-            delta = obj.scheduled_date - now
-            return math.ceil(delta.total_seconds() / 86400)
+            return _ceil_days(obj.scheduled_date - now)
     
     def get_property_id(self, obj):
-        machines = obj.machines.all()
-        logger.debug(f"[PreventiveMaintenanceDetailSerializer] get_property_id for PM {obj.pm_id}: {machines.count()} machines")
-        if machines:
-            # All machines must belong to the same property, so return the first one
-            return machines.first().property.property_id
-        return None
-    
-    def to_representation(self, instance):
-        """Override to add debug logging for machines"""
-        # Debug: Log machine information BEFORE serialization
-        machines_queryset = instance.machines.all()
-        machine_count = machines_queryset.count()
-        machine_ids = list(machines_queryset.values_list('machine_id', flat=True))
-        
-        # Use print for immediate visibility in docker logs
-        
-        logger.info(f"[PreventiveMaintenanceDetailSerializer] Serializing PM {instance.pm_id}: {machine_count} machines, IDs: {machine_ids}")
-        
-        representation = super().to_representation(instance)
-        
-        return representation
+        return _get_pm_property_id(obj)
 
     def create(self, validated_data):
         
         topic_ids = validated_data.pop('topic_ids', [])
         machine_ids = validated_data.pop('machine_ids', [])
-        instance = super().create(validated_data)
-        
-        if topic_ids:
-            instance.topics.set(topic_ids)
-        if machine_ids:
-            instance.machines.set(Machine.objects.filter(machine_id__in=machine_ids))
+        machine_pks = validated_data.pop('machine_pks', None)
+        with transaction.atomic():
+            instance = super().create(validated_data)
+            if topic_ids:
+                _link_new(instance.topics, topic_ids)
+            if machine_ids:
+                _link_new(instance.machines, _machine_pks(machine_pks, machine_ids))
         return instance
 
     def update(self, instance, validated_data):
         
         topic_ids = validated_data.pop('topic_ids', None)
         machine_ids = validated_data.pop('machine_ids', None)
+        machine_pks = validated_data.pop('machine_pks', None)
         procedure_template = validated_data.get('procedure_template')
         if procedure_template:
             template_frequency = getattr(procedure_template, 'frequency', None)
@@ -1387,12 +1664,12 @@ class PreventiveMaintenanceDetailSerializer(serializers.ModelSerializer):
                 validated_data['frequency'] = template_frequency
             if validated_data.get('frequency') == 'custom' and template_custom_days and not validated_data.get('custom_days'):
                 validated_data['custom_days'] = template_custom_days
-        instance = super().update(instance, validated_data)
-        
-        if topic_ids is not None:
-            instance.topics.set(topic_ids)
-        if machine_ids is not None:
-            instance.machines.set(Machine.objects.filter(machine_id__in=machine_ids))
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            if topic_ids is not None:
+                instance.topics.set(topic_ids)
+            if machine_ids is not None:
+                instance.machines.set(_machine_pks(machine_pks, machine_ids))
         return instance
 
     def validate(self, data):
@@ -1416,67 +1693,42 @@ class PreventiveMaintenanceDetailSerializer(serializers.ModelSerializer):
                 'custom_days': 'Custom days value is required when frequency is set to Custom'
             })
         
-        scheduled_date = data.get('scheduled_date')
-        completed_date = data.get('completed_date')
-        
         # Only validate completed_date if it's actually provided (not None/empty)
         # For new records, completed_date should be None/not provided
-        if scheduled_date and completed_date is not None:
-            # Handle both datetime objects and string dates
-            if isinstance(completed_date, str) and completed_date.strip() == '':
-                # Empty string - treat as not provided
-                completed_date = None
-            elif completed_date:
-                # Allow completion within 15 days before or after scheduled date
-                from datetime import timedelta
-                from django.utils import timezone as tz
-                
-                # Ensure dates are timezone-aware for comparison
-                if tz.is_naive(scheduled_date):
-                    scheduled_date = tz.make_aware(scheduled_date)
-                if isinstance(completed_date, str):
-                    from django.utils.dateparse import parse_datetime
-                    parsed_date = parse_datetime(completed_date)
-                    if parsed_date:
-                        if tz.is_naive(parsed_date):
-                            completed_date = tz.make_aware(parsed_date)
-                        else:
-                            completed_date = parsed_date
-                    else:
-                        completed_date = None
-                elif tz.is_naive(completed_date):
-                    completed_date = tz.make_aware(completed_date)
-                
-                if completed_date:
-                    date_diff = (completed_date - scheduled_date).days
-                    # Allow completion within 15 days before or after scheduled date
-                    if date_diff < -15 or date_diff > 15:
-                        raise serializers.ValidationError({
-                            'completed_date': f'Completion date must be within 15 days before or after the scheduled date ({scheduled_date.strftime("%Y-%m-%d")}). '
-                                            f'Your completion date ({completed_date.strftime("%Y-%m-%d")}) is {abs(date_diff)} days away.'
-                        })
+        scheduled_date = data.get('scheduled_date')
+        completed_date = _to_aware(data.get('completed_date')) if scheduled_date else None
+        if completed_date:
+            scheduled_date = _to_aware(scheduled_date)
+            date_diff = (completed_date - scheduled_date).days
+            # Allow completion within 15 days before or after scheduled date
+            if date_diff < -15 or date_diff > 15:
+                raise serializers.ValidationError({
+                    'completed_date': f'Completion date must be within 15 days before or after the scheduled date ({scheduled_date.strftime("%Y-%m-%d")}). '
+                                    f'Your completion date ({completed_date.strftime("%Y-%m-%d")}) is {abs(date_diff)} days away.'
+                })
         
         machine_ids = data.get('machine_ids', [])
         if machine_ids:
-            machines = Machine.objects.filter(machine_id__in=machine_ids)
-            if len(machines) != len(machine_ids):
-                raise serializers.ValidationError("One or more machine_ids are invalid.")
-            property_ids = set(machine.property.property_id for machine in machines)
-            if len(property_ids) > 1:
-                raise serializers.ValidationError("All machines must belong to the same property.")
+            machine_pks, error = _resolve_machine_ids(machine_ids)
+            if error:
+                raise serializers.ValidationError(error)
+            data['machine_pks'] = machine_pks
         
         return data
 
-class PreventiveMaintenanceCreateUpdateSerializer(serializers.ModelSerializer):
+class PreventiveMaintenanceCreateUpdateSerializer(PrefetchingSerializerMixin, serializers.ModelSerializer):
+    select_related = ('assigned_to__userprofile', 'procedure_template')
+    prefetch_related = ('topics', PREFETCH_MACHINES_WITH_PROPERTY)
+
     topics = TopicSerializer(many=True, read_only=True)
-    topic_ids = serializers.ListField(
+    topic_ids = IdListField(
         child=serializers.IntegerField(),
         write_only=True,
         required=False,
         allow_empty=True
     )
     machines = MachineSerializer(many=True, read_only=True)
-    machine_ids = serializers.ListField(
+    machine_ids = IdListField(
         child=serializers.CharField(),
         write_only=True,
         required=False,
@@ -1489,11 +1741,7 @@ class PreventiveMaintenanceCreateUpdateSerializer(serializers.ModelSerializer):
     procedure_template_id = serializers.IntegerField(source='procedure_template.id', read_only=True)
     assigned_to_name = serializers.SerializerMethodField()
     technician_name = serializers.SerializerMethodField()
-    assigned_to = serializers.PrimaryKeyRelatedField(
-        queryset=User.objects.all(),
-        required=False,
-        allow_null=True
-    )
+    assigned_to = CachedUserPKField(required=False, allow_null=True)
 
     class Meta:
         model = PreventiveMaintenance
@@ -1534,43 +1782,22 @@ class PreventiveMaintenanceCreateUpdateSerializer(serializers.ModelSerializer):
         # When FormData has multiple values for the same key, QueryDict.get() returns only the last value
         # We need to use getlist() to get all values and convert QueryDict to a regular dict
         if hasattr(data, 'getlist'):
-            # This is a QueryDict (from FormData)
-            machine_ids_raw = data.getlist('machine_ids')
-            topic_ids_raw = data.getlist('topic_ids')
-            
-            # Convert QueryDict to a regular dict, preserving lists for array fields
-            # Use items() but handle list fields specially
-            data_dict = {}
-            for key in data.keys():
-                # For list fields, use getlist() to preserve all values
-                if key in ['machine_ids', 'topic_ids']:
-                    values = data.getlist(key)
-                    if values:
-                        data_dict[key] = values
-                    else:
-                        data_dict[key] = []
-                else:
-                    # For other fields, get the value (or list if multiple)
-                    value = data.get(key)
-                    if value is not None:
-                        data_dict[key] = value
-            
-            # CRITICAL: Always set machine_ids and topic_ids from getlist() results
-            # This ensures we preserve all values even if the dict conversion loses them
-            data_dict['machine_ids'] = machine_ids_raw if machine_ids_raw else []
-            data_dict['topic_ids'] = topic_ids_raw if topic_ids_raw else []
+            querydict = data
+            data = {key: value for key, value in querydict.items() if value is not None}
+            data['machine_ids'] = querydict.getlist('machine_ids')
+            data['topic_ids'] = querydict.getlist('topic_ids')
             
-            logger.info(f"[to_internal_value] Converted QueryDict. machine_ids: {data_dict.get('machine_ids')}, topic_ids: {data_dict.get('topic_ids')}")
-            
-            # Replace data with the dict version
-            data = data_dict
+            logger.debug("[to_internal_value] Converted QueryDict. machine_ids: %s, topic_ids: %s",
+                         data['machine_ids'], data['topic_ids'])
+        elif isinstance(data, dict):
+            # JSON bodies are already plain dicts; copy so the request data stays untouched
+            data = data.copy()
 
         # Multipart FormData commonly sends optional select/date fields as empty
         # strings. DRF's related/date fields do not treat "" as null, so normalize
         # those values before field validation. This keeps optional fields from
         # turning an otherwise valid PM create request into a 400 response.
         if isinstance(data, dict):
-            data = data.copy()
             for nullable_field in (
                 'procedure_template',
                 'assigned_to',
@@ -1586,75 +1813,30 @@ class PreventiveMaintenanceCreateUpdateSerializer(serializers.ModelSerializer):
                         data[nullable_field] = None
                     else:
                         data.pop(nullable_field, None)
+
+            # Remove empty image fields that are not files
+            # Django ImageField expects either a file or the field to be absent
+            for image_field in ('before_image', 'after_image'):
+                value = data.get(image_field)
+                if value is not None and not hasattr(value, 'read'):
+                    del data[image_field]
         
-        # Remove empty image fields that are not files
-        # Django ImageField expects either a file or the field to be absent
-        if hasattr(data, 'get'):
-            # Handle QueryDict or dict-like objects
-            before_image = data.get('before_image')
-            after_image = data.get('after_image')
-            
-            # If before_image/after_image exist but are not files (empty strings, etc.), remove them
-            if before_image is not None and not hasattr(before_image, 'read'):
-                # Not a file object - remove it
-                if hasattr(data, '_mutable'):
-                    # QueryDict - create a copy and remove the key
-                    if not isinstance(data, dict):
-                        data = data.copy()
-                    data.pop('before_image', None)
-                elif isinstance(data, dict):
-                    # Regular dict - remove the key
-                    data = {k: v for k, v in data.items() if k != 'before_image' or hasattr(v, 'read')}
-            
-            if after_image is not None and not hasattr(after_image, 'read'):
-                # Not a file object - remove it
-                if hasattr(data, '_mutable'):
-                    # QueryDict - create a copy and remove the key
-                    if not isinstance(data, dict):
-                        data = data.copy()
-                    data.pop('after_image', None)
-                elif isinstance(data, dict):
-                    # Regular dict - remove the key
-                    data = {k: v for k, v in data.items() if k != 'after_image' or hasattr(v, 'read')}
-        
-        result = super().to_internal_value(data)
-        
-        # CRITICAL: Ensure machine_ids is preserved after parent serializer processing
-        if isinstance(result, dict):
-            result_machine_ids = result.get('machine_ids')
-            result_topic_ids = result.get('topic_ids')
-            
-            logger.info(f"[to_internal_value] Result machine_ids: {result_machine_ids} (type: {type(result_machine_ids)})")
-            
-            # If machine_ids was lost or is empty but we had it in input data, restore it
-            if isinstance(data, dict) and 'machine_ids' in data:
-                input_machine_ids = data.get('machine_ids', [])
-                if input_machine_ids and (not result_machine_ids or (isinstance(result_machine_ids, list) and len(result_machine_ids) == 0)):
-                    logger.warning(f"[to_internal_value] ⚠️ machine_ids lost! Restoring: {input_machine_ids}")
-                    result['machine_ids'] = input_machine_ids if isinstance(input_machine_ids, list) else [input_machine_ids]
-        else:
-            logger.warning(f"[to_internal_value] Result is not a dict: {type(result)}")
-        
-        return result
+        return super().to_internal_value(data)
 
     def get_before_image_url(self, obj):
         request = self.context.get('request')
         if obj.before_image and request:
-            return request.build_absolute_uri(obj.before_image.url)
+            return _absolute_uri(self.context, obj.before_image.url)
         return None
 
     def get_after_image_url(self, obj):
         request = self.context.get('request')
         if obj.after_image and request:
-            return request.build_absolute_uri(obj.after_image.url)
+            return _absolute_uri(self.context, obj.after_image.url)
         return None
 
     def get_property_id(self, obj):
-        machines = obj.machines.all()
-        if machines:
-            # All machines must belong to the same property, so return the first one
-            return machines.first().property.property_id
-        return None
+        return _get_pm_property_id(obj)
 
     def create(self, validated_data):
         
@@ -1662,22 +1844,7 @@ class PreventiveMaintenanceCreateUpdateSerializer(serializers.ModelSerializer):
         # These are ManyToMany relationships that need to be set after instance creation
         topic_ids = validated_data.pop('topic_ids', [])
         machine_ids = validated_data.pop('machine_ids', [])
-        
-        # Ensure machine_ids is a list (handle case where it might be a string or single value)
-        if machine_ids and not isinstance(machine_ids, list):
-            machine_ids = [machine_ids] if machine_ids else []
-        # Filter out empty strings and None values
-        if isinstance(machine_ids, list):
-            machine_ids = [str(mid).strip() for mid in machine_ids if mid and str(mid).strip()]
-        else:
-            machine_ids = []
-        
-        # Ensure topic_ids is a list
-        if topic_ids and not isinstance(topic_ids, list):
-            topic_ids = [topic_ids] if topic_ids else []
-        # Filter out None values and ensure integers
-        if isinstance(topic_ids, list):
-            topic_ids = [int(tid) for tid in topic_ids if tid is not None]
+        machine_pks = validated_data.pop('machine_pks', None)
         
         # Auto-calculate scheduled_date based on frequency if procedure_template is provided
         procedure_template = validated_data.get('procedure_template')
@@ -1709,96 +1876,30 @@ class PreventiveMaintenanceCreateUpdateSerializer(serializers.ModelSerializer):
                 needs_scheduled_date = True
             
             if needs_scheduled_date and frequency:
-                now = timezone.now()
-                if frequency == 'daily':
-                    next_schedule = now + timedelta(days=1)
-                elif frequency == 'weekly':
-                    next_schedule = now + timedelta(weeks=1)
-                elif frequency == 'monthly':
-                    # Add one month
-                    month = now.month + 1
-                    year = now.year
-                    if month > 12:
-                        month = 1
-                        year += 1
-                    # Handle different month lengths
-                    day = min(now.day, [31, 29 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 28, 
-                                         31, 30, 31, 30, 31, 31, 30, 31, 30, 31][month-1])
-                    next_schedule = now.replace(year=year, month=month, day=day)
-                elif frequency == 'quarterly':
-                    # Add three months
-                    month = now.month + 3
-                    year = now.year
-                    if month > 12:
-                        month -= 12
-                        year += 1
-                    day = min(now.day, [31, 29 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 28, 
-                                         31, 30, 31, 30, 31, 31, 30, 31, 30, 31][month-1])
-                    next_schedule = now.replace(year=year, month=month, day=day)
-                elif frequency == 'semi_annual':
-                    # Add six months
-                    month = now.month + 6
-                    year = now.year
-                    if month > 12:
-                        month -= 12
-                        year += 1
-                    day = min(now.day, [31, 29 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 28, 
-                                         31, 30, 31, 30, 31, 31, 30, 31, 30, 31][month-1])
-                    next_schedule = now.replace(year=year, month=month, day=day)
-                elif frequency == 'annual':
-                    # Add one year
-                    next_schedule = now.replace(year=now.year + 1)
-                elif frequency == 'custom' and procedure_template.custom_days:
-                    next_schedule = now + timedelta(days=procedure_template.custom_days)
-                else:
-                    # Default to monthly if frequency is not recognized
-                    month = now.month + 1
-                    year = now.year
-                    if month > 12:
-                        month = 1
-                        year += 1
-                    day = min(now.day, [31, 29 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 28, 
-                                         31, 30, 31, 30, 31, 31, 30, 31, 30, 31][month-1])
-                    next_schedule = now.replace(year=year, month=month, day=day)
-                
-                validated_data['scheduled_date'] = next_schedule
-        
-        instance = super().create(validated_data)
-        
-        # Set ManyToMany relationships after instance creation
+                # relativedelta clamps month ends (Jan 31 + 1 month -> Feb 28/29)
+                delta = _pm_schedule_delta(frequency, procedure_template.custom_days)
+                validated_data['scheduled_date'] = timezone.now() + delta
         
-        if topic_ids:
-            instance.topics.set(topic_ids)
+        with transaction.atomic():
+            instance = super().create(validated_data)
 
-        has_machines = machine_ids and len(machine_ids) > 0 if isinstance(machine_ids, list) else bool(machine_ids)
-        
-        if has_machines:
-            logger.info(f"[PreventiveMaintenanceCreateUpdateSerializer] Setting {len(machine_ids)} machines: {machine_ids}")
-            
-            # Query machines by machine_id
-            machines = Machine.objects.filter(machine_id__in=machine_ids)
-            found_count = machines.count()
-            found_ids = list(machines.values_list('machine_id', flat=True))
-            
-            logger.info(f"[PreventiveMaintenanceCreateUpdateSerializer] Found {found_count} machines: {found_ids}")
-            
-            if found_count == 0:
-                logger.warning(f"[PreventiveMaintenanceCreateUpdateSerializer] ⚠️ No machines found for IDs: {machine_ids}")
-            
-            # Set the machines relationship
-            instance.machines.set(machines)
-            
-            # Refresh instance to ensure machines are loaded
-            instance.refresh_from_db()
-            
-            # Verify machines were set
-            final_machine_count = instance.machines.count()
-            final_machine_ids = list(instance.machines.values_list('machine_id', flat=True))
-            
-            logger.info(f"[PreventiveMaintenanceCreateUpdateSerializer] ✅ Machines set. Count: {final_machine_count}, IDs: {final_machine_ids}")
-            
-            if final_machine_count == 0 and found_count > 0:
-                logger.error(f"[PreventiveMaintenanceCreateUpdateSerializer] ⚠️ ERROR: Machines found but not set!")
+            # Set ManyToMany relationships after instance creation
+            if topic_ids:
+                _link_new(instance.topics, topic_ids)
+
+            if machine_ids:
+                # Machine pks were resolved in validate()
+                machine_pks = _machine_pks(machine_pks, machine_ids)
+                logger.debug("[PreventiveMaintenanceCreateUpdateSerializer] Linking machines %s -> pks %s",
+                             machine_ids, machine_pks)
+
+                if not machine_pks:
+                    logger.warning("[PreventiveMaintenanceCreateUpdateSerializer] ⚠️ No machines found for IDs: %s",
+                                   machine_ids)
+
+                # Set the machines relationship. The bulk INSERT either links
+                # every pk or raises, so no read-back is needed to confirm it.
+                _link_new(instance.machines, machine_pks)
 
         return instance
 
@@ -1806,6 +1907,7 @@ class PreventiveMaintenanceCreateUpdateSerializer(serializers.ModelSerializer):
         
         topic_ids = validated_data.pop('topic_ids', None)
         machine_ids = validated_data.pop('machine_ids', None)
+        machine_pks = validated_data.pop('machine_pks', None)
         procedure_template = validated_data.get('procedure_template')
         if procedure_template:
             template_frequency = getattr(procedure_template, 'frequency', None)
@@ -1814,18 +1916,14 @@ class PreventiveMaintenanceCreateUpdateSerializer(serializers.ModelSerializer):
                 validated_data['frequency'] = template_frequency
             if validated_data.get('frequency') == 'custom' and template_custom_days and not validated_data.get('custom_days'):
                 validated_data['custom_days'] = template_custom_days
-        instance = super().update(instance, validated_data)
-        
-        if topic_ids is not None:
-            instance.topics.set(topic_ids)
-        if machine_ids is not None:
-            instance.machines.set(Machine.objects.filter(machine_id__in=machine_ids))
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            if topic_ids is not None:
+                instance.topics.set(topic_ids)
+            if machine_ids is not None:
+                instance.machines.set(_machine_pks(machine_pks, machine_ids))
         return instance
 
-    def validate_assigned_to(self, value):
-        """Custom validation for assigned_to field"""
-        return value
-
     def validate(self, data):
         frequency = data.get('frequency')
         custom_days = data.get('custom_days')
@@ -1869,22 +1967,35 @@ class PreventiveMaintenanceCreateUpdateSerializer(serializers.ModelSerializer):
             })
         
         # Validate machine_ids exist and belong to the same property
-        machines = Machine.objects.filter(machine_id__in=machine_ids)
-        if len(machines) != len(machine_ids):
-            raise serializers.ValidationError({
-                'machine_ids': 'One or more machine_ids are invalid.'
-            })
-        property_ids = set(machine.property.property_id for machine in machines)
-        if len(property_ids) > 1:
-            raise serializers.ValidationError({
-                'machine_ids': 'All machines must belong to the same property.'
-            })
+        machine_pks, error = _resolve_machine_ids(machine_ids)
+        if error:
+            raise serializers.ValidationError({'machine_ids': error})
+        data['machine_pks'] = machine_pks
         
         return data
 
-class PreventiveMaintenanceCompleteSerializer(serializers.ModelSerializer):
+class PMPropertyMapListSerializer(serializers.ListSerializer):
+    """Resolve property_ids for ``many=True`` rows rendered without machines prefetched.
+
+    Such rows would otherwise cost a M2M and a property SELECT each in
+    ``get_property_id``; the map is rebuilt for the rows of every render.
+    """
+
+    property_map = None
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, BaseManager) else data
+        rows = list(iterable)
+        missing = [pm.pk for pm in rows if not _machines_prefetched(pm)]
+        self.property_map = _pm_property_map(missing) if missing else {}
+        return super().to_representation(rows)
+
+
+class PreventiveMaintenanceCompleteSerializer(PrefetchingSerializerMixin, serializers.ModelSerializer):
+    prefetch_related = (PREFETCH_MACHINES_WITH_PROPERTY,)
+
     machines = MachineSerializer(many=True, read_only=True)
-    machine_ids = serializers.ListField(
+    machine_ids = IdListField(
         child=serializers.CharField(),
         write_only=True,
         required=False,
@@ -1899,59 +2010,28 @@ class PreventiveMaintenanceCompleteSerializer(serializers.ModelSerializer):
             'scheduled_date', 'next_due_date'  # Allow updating scheduled_date for next occurrence
         ]
         read_only_fields = ['next_due_date']  # Will be set by the view
+        list_serializer_class = PMPropertyMapListSerializer
 
     def get_property_id(self, obj):
-        machines = obj.machines.all()
-        if machines:
-            # All machines must belong to the same property, so return the first one
-            return machines.first().property.property_id
-        return None
+        return _get_pm_property_id(obj, getattr(self.parent, 'property_map', None))
 
     def update(self, instance, validated_data):
         machine_ids = validated_data.pop('machine_ids', None)
-        instance = super().update(instance, validated_data)
-        if machine_ids is not None:
-            instance.machines.set(Machine.objects.filter(machine_id__in=machine_ids))
+        machine_pks = validated_data.pop('machine_pks', None)
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            if machine_ids is not None:
+                instance.machines.set(_machine_pks(machine_pks, machine_ids))
         return instance
 
     def validate(self, data):
-        scheduled_date = self.instance.scheduled_date if self.instance else None
-        completed_date = data.get('completed_date')
-
-        # If no completed_date provided, use current time
-        if completed_date is None:
-            from django.utils import timezone
-            completed_date = timezone.now()
-            data['completed_date'] = completed_date
-
-        # Ensure completed_date is a datetime object (handle ISO string conversion)
-        if isinstance(completed_date, str):
-            from django.utils.dateparse import parse_datetime
-            from django.utils import timezone
-            parsed_date = parse_datetime(completed_date)
-            if parsed_date:
-                # Make timezone-aware if it's naive
-                if timezone.is_naive(parsed_date):
-                    completed_date = timezone.make_aware(parsed_date)
-                else:
-                    completed_date = parsed_date
-                data['completed_date'] = completed_date
-            else:
-                # If parsing fails, use current time
-                completed_date = timezone.now()
-                data['completed_date'] = completed_date
+        scheduled_date = _to_aware(self.instance.scheduled_date) if self.instance else None
+        # Missing or unparseable completed_date falls back to the current time
+        completed_date = _to_aware(data.get('completed_date')) or timezone.now()
+        data['completed_date'] = completed_date
 
         # Validate that completion date is within 15 days before or after scheduled date
-        if scheduled_date and completed_date:
-            from datetime import timedelta
-            
-            # Ensure scheduled_date is timezone-aware for comparison
-            from django.utils import timezone as tz
-            if tz.is_naive(scheduled_date):
-                scheduled_date = tz.make_aware(scheduled_date)
-            if tz.is_naive(completed_date):
-                completed_date = tz.make_aware(completed_date)
-            
+        if scheduled_date:
             # Calculate the difference in days
             date_diff = (completed_date - scheduled_date).days
             
@@ -1964,25 +2044,26 @@ class PreventiveMaintenanceCompleteSerializer(serializers.ModelSerializer):
 
         machine_ids = data.get('machine_ids', [])
         if machine_ids:
-            machines = Machine.objects.filter(machine_id__in=machine_ids)
-            if len(machines) != len(machine_ids):
-                raise serializers.ValidationError("One or more machine_ids are invalid.")
-            property_ids = set(machine.property.property_id for machine in machines)
-            if len(property_ids) > 1:
-                raise serializers.ValidationError("All machines must belong to the same property.")
+            machine_pks, error = _resolve_machine_ids(machine_ids)
+            if error:
+                raise serializers.ValidationError(error)
+            data['machine_pks'] = machine_pks
 
         return data
 
-class PreventiveMaintenanceSerializer(serializers.ModelSerializer):
+class PreventiveMaintenanceSerializer(PrefetchingSerializerMixin, serializers.ModelSerializer):
+    select_related = ('created_by__userprofile', 'assigned_to__userprofile')
+    prefetch_related = ('topics', PREFETCH_MACHINES_WITH_PROPERTY)
+
     topics = TopicSerializer(many=True, read_only=True)
-    topic_ids = serializers.ListField(
+    topic_ids = IdListField(
         child=serializers.IntegerField(),
         write_only=True,
         required=False,
         allow_empty=True
     )
     machines = MachineSerializer(many=True, read_only=True)
-    machine_ids = serializers.ListField(
+    machine_ids = IdListField(
         child=serializers.CharField(),
         write_only=True,
         required=False,
@@ -1991,11 +2072,7 @@ class PreventiveMaintenanceSerializer(serializers.ModelSerializer):
     before_image_url = serializers.SerializerMethodField()
     after_image_url = serializers.SerializerMethodField()
     property_id = serializers.SerializerMethodField()
-    assigned_to = serializers.PrimaryKeyRelatedField(
-        queryset=User.objects.all(),
-        required=False,
-        allow_null=True
-    )
+    assigned_to = CachedUserPKField(required=False, allow_null=True)
     assigned_to_details = UserSummarySerializer(source='assigned_to', read_only=True)
     created_by_details = UserSummarySerializer(source='created_by', read_only=True)
     assigned_to_name = serializers.SerializerMethodField()
@@ -2021,13 +2098,10 @@ class PreventiveMaintenanceSerializer(serializers.ModelSerializer):
             'before_image': {'required': False},
             'after_image': {'required': False},
         }
+        list_serializer_class = PMPropertyMapListSerializer
 
     def get_property_id(self, obj):
-        machines = obj.machines.all()
-        if machines:
-            # All machines must belong to the same property, so return the first one
-            return machines.first().property.property_id
-        return None
+        return _get_pm_property_id(obj, getattr(self.parent, 'property_map', None))
 
     def get_assigned_to_name(self, obj):
         return get_user_display_name(obj.assigned_to)
@@ -2041,44 +2115,46 @@ class PreventiveMaintenanceSerializer(serializers.ModelSerializer):
     def get_before_image_url(self, obj):
         request = self.context.get('request')
         if obj.before_image and request:
-            return request.build_absolute_uri(obj.before_image.url)
+            return _absolute_uri(self.context, obj.before_image.url)
         return None
 
     def get_after_image_url(self, obj):
         request = self.context.get('request')
         if obj.after_image and request:
-            return request.build_absolute_uri(obj.after_image.url)
+            return _absolute_uri(self.context, obj.after_image.url)
         return None
 
     def create(self, validated_data):
         topic_ids = validated_data.pop('topic_ids', [])
         machine_ids = validated_data.pop('machine_ids', [])
-        instance = super().create(validated_data)
-        if topic_ids:
-            instance.topics.set(topic_ids)
-        if machine_ids:
-            instance.machines.set(Machine.objects.filter(machine_id__in=machine_ids))
+        machine_pks = validated_data.pop('machine_pks', None)
+        with transaction.atomic():
+            instance = super().create(validated_data)
+            if topic_ids:
+                _link_new(instance.topics, topic_ids)
+            if machine_ids:
+                _link_new(instance.machines, _machine_pks(machine_pks, machine_ids))
         return instance
 
     def update(self, instance, validated_data):
         topic_ids = validated_data.pop('topic_ids', None)
         machine_ids = validated_data.pop('machine_ids', None)
-        instance = super().update(instance, validated_data)
-        if topic_ids is not None:
-            instance.topics.set(topic_ids)
-        if machine_ids is not None:
-            instance.machines.set(Machine.objects.filter(machine_id__in=machine_ids))
+        machine_pks = validated_data.pop('machine_pks', None)
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            if topic_ids is not None:
+                instance.topics.set(topic_ids)
+            if machine_ids is not None:
+                instance.machines.set(_machine_pks(machine_pks, machine_ids))
         return instance
 
     def validate(self, data):
         machine_ids = data.get('machine_ids', [])
         if machine_ids:
-            machines = Machine.objects.filter(machine_id__in=machine_ids)
-            if len(machines) != len(machine_ids):
-                raise serializers.ValidationError("One or more machine_ids are invalid.")
-            property_ids = set(machine.property.property_id for machine in machines)
-            if len(property_ids) > 1:
-                raise serializers.ValidationError("All machines must belong to the same property.")
+            machine_pks, error = _resolve_machine_ids(machine_ids)
+            if error:
+                raise serializers.ValidationError(error)
+            data['machine_pks'] = machine_pks
         return data
 
 class MaintenanceStepSerializer(serializers.Serializer):
@@ -2127,7 +2203,8 @@ class MaintenanceProcedureSerializer(serializers.ModelSerializer):
     
     def get_machine_ids(self, obj):
         """Return machine identifiers explicitly linked to this template."""
-        return list(obj.machines.values_list('machine_id', flat=True))
+        # Same rows get_machines reads; .all() is served by the view's prefetch
+        return [machine.machine_id for machine in obj.machines.all()]
 
     def get_machines(self, obj):
         """Return lightweight machine details for filtering template concerns in clients."""
@@ -2201,11 +2278,16 @@ class MaintenanceProcedureListSerializer(serializers.ModelSerializer):
     
     def get_schedule_count(self, obj):
         """Get count of maintenance schedules for this task"""
-        return obj.maintenance_schedules.count()
+        # MaintenanceProcedureViewSet annotates this on the list queryset
+        count = getattr(obj, 'schedule_count', None)
+        if count is None:
+            count = obj.maintenance_schedules.count()
+        return count
 
     def get_machine_ids(self, obj):
         """Return machine identifiers explicitly linked to this template."""
-        return list(obj.machines.values_list('machine_id', flat=True))
+        # Same rows get_machines reads; .all() is served by the view's prefetch
+        return [machine.machine_id for machine in obj.machines.all()]
 
     def get_machines(self, obj):
         """Return lightweight machine details for filtering template concerns in clients."""
@@ -2247,7 +2329,7 @@ class MaintenanceTaskImageSerializer(serializers.ModelSerializer):
         """Get full URL for the image"""
         request = self.context.get('request')
         if obj.image_url and request:
-            return request.build_absolute_uri(obj.image_url.url)
+            return _absolute_uri(self.context, obj.image_url.url)
         return None
 
 
@@ -2267,7 +2349,7 @@ class MaintenanceTaskImageListSerializer(serializers.ModelSerializer):
         """Get full URL for the image"""
         request = self.context.get('request')
         if obj.image_url and request:
-            return request.build_absolute_uri(obj.image_url.url)
+            return _absolute_uri(self.context, obj.image_url.url)
         return None
 
 # Utility Consumption Serializers
@@ -2281,11 +2363,25 @@ _UTILITY_DECIMAL_KWARGS = dict(
 )
 
 
+def _choice_label(labels, value):
+    """``get_FOO_display()`` from a prebuilt choices dict.
+
+    Django rebuilds a dict from the field's choices on every call; list rows
+    only need one lookup. Unknown values fall through as text, as they do there.
+    """
+    if value is None:
+        return None
+    return str(labels.get(value, value))
+
+
+_MONTH_LABELS = dict(UtilityConsumption._meta.get_field('month').flatchoices)
+
+
 class UtilityConsumptionSerializer(serializers.ModelSerializer):
     """Serializer for Utility Consumption records"""
     property_name = serializers.CharField(source='property.name', read_only=True)
     property_id = serializers.CharField(source='property.property_id', read_only=True)
-    month_display = serializers.CharField(source='get_month_display', read_only=True)
+    month_display = serializers.SerializerMethodField()
     created_by_username = serializers.SerializerMethodField()
     created_by_name = serializers.SerializerMethodField()
     totalkwh = serializers.DecimalField(**_UTILITY_DECIMAL_KWARGS)
@@ -2326,6 +2422,9 @@ class UtilityConsumptionSerializer(serializers.ModelSerializer):
 
     def get_created_by_username(self, obj):
         return get_user_public_username(obj.created_by)
+
+    def get_month_display(self, obj):
+        return _choice_label(_MONTH_LABELS, obj.month)
     
     def validate(self, data):
         """Validate that property is provided"""
@@ -2348,7 +2447,7 @@ class UtilityConsumptionListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for listing utility consumption records"""
     property_name = serializers.CharField(source='property.name', read_only=True)
     property_id = serializers.CharField(source='property.property_id', read_only=True)
-    month_display = serializers.CharField(source='get_month_display', read_only=True)
+    month_display = serializers.SerializerMethodField()
     totalkwh = serializers.DecimalField(**_UTILITY_DECIMAL_KWARGS)
     onpeakkwh = serializers.DecimalField(**_UTILITY_DECIMAL_KWARGS)
     offpeakkwh = serializers.DecimalField(**_UTILITY_DECIMAL_KWARGS)
@@ -2377,6 +2476,57 @@ class UtilityConsumptionListSerializer(serializers.ModelSerializer):
             'updated_at'
         ]
 
+    def get_month_display(self, obj):
+        return _choice_label(_MONTH_LABELS, obj.month)
+
+    # values() lookup behind each field, in Meta.fields order
+    BULK_VALUES = {
+        'id': 'id',
+        'property_id': 'property__property_id',
+        'property_name': 'property__name',
+        'month': 'month',
+        'month_display': 'month',
+        'year': 'year',
+        'totalkwh': 'totalkwh',
+        'onpeakkwh': 'onpeakkwh',
+        'offpeakkwh': 'offpeakkwh',
+        'totalelectricity': 'totalelectricity',
+        'electricity_cost_budget': 'electricity_cost_budget',
+        'water': 'water',
+        'nightsale': 'nightsale',
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+    }
+
+    @classmethod
+    def bulk_values(cls, queryset):
+        """Narrow ``queryset`` to the plain column dicts ``serialize_bulk`` reads."""
+        return queryset.values('property', *set(cls.BULK_VALUES.values()))
+
+    @classmethod
+    def serialize_bulk(cls, rows):
+        """Render ``bulk_values`` rows without model instances.
+
+        Produces the same output as ``cls(queryset, many=True).data``: values
+        are formatted by this serializer's own fields, and rows without a
+        property omit ``property_id``/``property_name`` just as DRF skips a
+        ``property.*`` source that hits ``None``.
+        """
+        fields = cls().fields
+        data = []
+        for row in rows:
+            item = {}
+            for name, key in cls.BULK_VALUES.items():
+                if key.startswith('property__') and row['property'] is None:
+                    continue
+                value = row[key]
+                if name == 'month_display':
+                    item[name] = _choice_label(_MONTH_LABELS, value)
+                else:
+                    item[name] = None if value is None else fields[name].to_representation(value)
+            data.append(item)
+        return data
+
 
 class InventoryUsageSerializer(serializers.ModelSerializer):
     inventory_item_id = serializers.CharField(source='inventory.item_id', read_only=True)
@@ -2404,6 +2554,10 @@ class InventoryUsageSerializer(serializers.ModelSerializer):
         return get_user_display_name(obj.consumed_by)
 
 
+_INVENTORY_STATUS_LABELS = dict(Inventory._meta.get_field('status').flatchoices)
+_INVENTORY_CATEGORY_LABELS = dict(Inventory._meta.get_field('category').flatchoices)
+
+
 class InventorySerializer(serializers.ModelSerializer):
     """Serializer for Inventory items"""
     property_name = serializers.CharField(source='property.name', read_only=True)
@@ -2412,8 +2566,8 @@ class InventorySerializer(serializers.ModelSerializer):
     room_id = serializers.CharField(source='room.room_id', read_only=True)
     created_by_username = serializers.SerializerMethodField()
     created_by_name = serializers.SerializerMethodField()
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
-    category_display = serializers.CharField(source='get_category_display', read_only=True)
+    status_display = serializers.SerializerMethodField()
+    category_display = serializers.SerializerMethodField()
     image_url = serializers.SerializerMethodField()
     job_ids = serializers.SerializerMethodField()
     pm_ids = serializers.SerializerMethodField()
@@ -2467,22 +2621,28 @@ class InventorySerializer(serializers.ModelSerializer):
     def get_created_by_username(self, obj):
         return get_user_public_username(obj.created_by)
     
+    def get_status_display(self, obj):
+        return _choice_label(_INVENTORY_STATUS_LABELS, obj.status)
+    
+    def get_category_display(self, obj):
+        return _choice_label(_INVENTORY_CATEGORY_LABELS, obj.category)
+    
     def get_image_url(self, obj):
         """Get the image URL"""
         if obj.image and hasattr(obj.image, 'url'):
             request = self.context.get('request')
             if request:
-                return request.build_absolute_uri(obj.image.url)
+                return _absolute_uri(self.context, obj.image.url)
             return obj.image.url
         return None
     
     def get_job_ids(self, obj):
         """Return all related job IDs"""
-        return list(obj.jobs.values_list('job_id', flat=True))
+        return [job.job_id for job in obj.jobs.all()]
     
     def get_pm_ids(self, obj):
         """Return all related preventive maintenance IDs"""
-        return list(obj.preventive_maintenances.values_list('pm_id', flat=True))
+        return [pm.pm_id for pm in obj.preventive_maintenances.all()]
     
     def get_jobs_detail(self, obj):
         """Return detailed information about related jobs"""
@@ -2546,8 +2706,8 @@ class InventoryListSerializer(serializers.ModelSerializer):
     property_name = serializers.CharField(source='property.name', read_only=True)
     property_id = serializers.CharField(source='property.property_id', read_only=True)
     room_name = serializers.CharField(source='room.name', read_only=True)
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
-    category_display = serializers.CharField(source='get_category_display', read_only=True)
+    status_display = serializers.SerializerMethodField()
+    category_display = serializers.SerializerMethodField()
     job_id = serializers.SerializerMethodField()
     job_description = serializers.SerializerMethodField()
     pm_id = serializers.SerializerMethodField()
@@ -2592,73 +2752,111 @@ class InventoryListSerializer(serializers.ModelSerializer):
             'updated_at'
         ]
     
+    def get_status_display(self, obj):
+        return _choice_label(_INVENTORY_STATUS_LABELS, obj.status)
+    
+    def get_category_display(self, obj):
+        return _choice_label(_INVENTORY_CATEGORY_LABELS, obj.category)
+    
     def get_image_url(self, obj):
         """Get the image URL"""
         if obj.image and hasattr(obj.image, 'url'):
             request = self.context.get('request')
             if request:
-                return request.build_absolute_uri(obj.image.url)
+                return _absolute_uri(self.context, obj.image.url)
             return obj.image.url
         return None
     
-    def _get_primary_job(self, obj):
-        return obj.jobs.all().first()
-    
-    def _get_primary_pm(self, obj):
-        return obj.preventive_maintenances.all().first()
+    # Related rows come from the view's to_attr prefetch lists (or .all()
+    # elsewhere); .values_list()/.filter() would query per item. Each
+    # relation is walked once per row and the result shared by the
+    # primary/ids/detail fields.
+    @staticmethod
+    def _related_rows(obj, name):
+        rows = getattr(obj, f'prefetched_{name}', None)
+        return rows if rows is not None else list(getattr(obj, name).all())
+    
+    def _jobs_bundle(self, obj):
+        cached = getattr(self, '_jobs_bundle_for', None)
+        if cached is not None and cached[0] is obj:
+            return cached[1]
+        jobs = self._related_rows(obj, 'jobs')
+        bundle = {
+            'primary': jobs[0] if jobs else None,
+            'ids': [job.job_id for job in jobs],
+            'detail': [
+                {
+                    'job_id': job.job_id,
+                    'description': job.description,
+                    'status': job.status,
+                }
+                for job in jobs[:5]
+            ],
+        }
+        self._jobs_bundle_for = (obj, bundle)
+        return bundle
+    
+    def _pms_bundle(self, obj):
+        cached = getattr(self, '_pms_bundle_for', None)
+        if cached is not None and cached[0] is obj:
+            return cached[1]
+        pms = self._related_rows(obj, 'preventive_maintenances')
+        bundle = {
+            'primary': pms[0] if pms else None,
+            'ids': [pm.pm_id for pm in pms],
+            'detail': [
+                {
+                    'pm_id': pm.pm_id,
+                    'title': pm.pmtitle,
+                    'status': pm.status,
+                }
+                for pm in pms[:5]
+            ],
+        }
+        self._pms_bundle_for = (obj, bundle)
+        return bundle
     
     def get_job_id(self, obj):
-        job = self._get_primary_job(obj)
+        job = self._jobs_bundle(obj)['primary']
         return job.job_id if job else None
     
     def get_job_description(self, obj):
-        job = self._get_primary_job(obj)
+        job = self._jobs_bundle(obj)['primary']
         return job.description if job else None
     
     def get_pm_id(self, obj):
-        pm = self._get_primary_pm(obj)
+        pm = self._pms_bundle(obj)['primary']
         return pm.pm_id if pm else None
     
     def get_pm_title(self, obj):
-        pm = self._get_primary_pm(obj)
+        pm = self._pms_bundle(obj)['primary']
         return pm.pmtitle if pm else None
     
     def get_job_ids(self, obj):
-        return list(obj.jobs.values_list('job_id', flat=True))
+        return self._jobs_bundle(obj)['ids']
     
     def get_pm_ids(self, obj):
-        return list(obj.preventive_maintenances.values_list('pm_id', flat=True))
+        return self._pms_bundle(obj)['ids']
     
     def get_jobs_detail(self, obj):
-        jobs = obj.jobs.all()[:5]
-        return [
-            {
-                'job_id': job.job_id,
-                'description': job.description,
-                'status': job.status,
-            }
-            for job in jobs
-        ]
+        return self._jobs_bundle(obj)['detail']
     
     def get_preventive_maintenances_detail(self, obj):
-        pms = obj.preventive_maintenances.all()[:5]
-        return [
-            {
-                'pm_id': pm.pm_id,
-                'title': pm.pmtitle,
-                'status': pm.status,
-            }
-            for pm in pms
-        ]
+        return self._pms_bundle(obj)['detail']
     
+    # item_id is unique, so obj's own relation is the only place a match can
+    # live; no per-row fallback query is needed when the scan finds nothing.
     def get_last_job_by_user(self, obj):
         """Get the last job that used this inventory item by the current user"""
-        request = self.context.get('request')
-        if not request or not request.user:
+        user = _request_user(self.context)
+        if user is None:
             return None
         
-        user = request.user
-        user_job = obj.jobs.filter(user=user).order_by('-updated_at').first()
+        user_job = max(
+            (job for job in self._related_rows(obj, 'jobs') if job.user_id == user.pk),
+            key=attrgetter('updated_at'),
+            default=None,
+        )
         if user_job:
             return {
                 'job_id': user_job.job_id,
@@ -2666,42 +2864,22 @@ class InventoryListSerializer(serializers.ModelSerializer):
                 'full_description': user_job.description
             }
         
-        from .models import Inventory
-        last_inventory = (
-            Inventory.objects.filter(
-                jobs__user=user,
-                item_id=obj.item_id
-            )
-            .order_by('-updated_at')
-            .prefetch_related('jobs')
-            .first()
-        )
-        
-        if last_inventory:
-            related_job = (
-                last_inventory.jobs.filter(user=user)
-                .order_by('-updated_at')
-                .first()
-            )
-            if related_job:
-                return {
-                    'job_id': related_job.job_id,
-                    'description': related_job.description[:50] + '...' if len(related_job.description) > 50 else related_job.description,
-                    'full_description': related_job.description
-                }
-        
         return None
     
     def get_last_pm_by_user(self, obj):
         """Get the last PM that used this inventory item by the current user"""
-        request = self.context.get('request')
-        if not request or not request.user:
+        user = _request_user(self.context)
+        if user is None:
             return None
         
-        user = request.user
-        pm = obj.preventive_maintenances.filter(
-            Q(assigned_to=user) | Q(created_by=user)
-        ).order_by('-updated_at').first()
+        pm = max(
+            (
+                pm for pm in self._related_rows(obj, 'preventive_maintenances')
+                if user.pk in (pm.assigned_to_id, pm.created_by_id)
+            ),
+            key=attrgetter('updated_at'),
+            default=None,
+        )
         if pm:
             return {
                 'pm_id': pm.pm_id,
@@ -2709,34 +2887,4 @@ class InventoryListSerializer(serializers.ModelSerializer):
                 'full_title': pm.pmtitle
             }
         
-        from .models import Inventory
-        last_inventory = (
-            Inventory.objects.filter(
-                preventive_maintenances__isnull=False,
-                item_id=obj.item_id
-            )
-            .filter(
-                Q(preventive_maintenances__assigned_to=user) |
-                Q(preventive_maintenances__created_by=user)
-            )
-            .order_by('-updated_at')
-            .prefetch_related('preventive_maintenances')
-            .first()
-        )
-        
-        if last_inventory:
-            pm = (
-                last_inventory.preventive_maintenances.filter(
-                    Q(assigned_to=user) | Q(created_by=user)
-                )
-                .order_by('-updated_at')
-                .first()
-            )
-            if pm:
-                return {
-                    'pm_id': pm.pm_id,
-                    'title': pm.pmtitle[:50] + '...' if len(pm.pmtitle) > 50 else pm.pmtitle,
-                    'full_title': pm.pmtitle
-                }
-        
         return None
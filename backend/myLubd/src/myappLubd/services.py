@@ -2,27 +2,33 @@
 Service layer for business logic separation
 """
 from typing import Dict, List, Optional, Any, Tuple
+import base64
 import re
 from collections import defaultdict
-from datetime import datetime
-from calendar import monthrange
+from itertools import islice
+from datetime import datetime, timedelta
+from dateutil.relativedelta import relativedelta
 import csv
 from io import StringIO
 from django.db import transaction, connection
 from django.db.utils import IntegrityError
 from django.core.exceptions import ValidationError
 from django.utils import timezone
-from django.db.models import Q, Count, F, Prefetch
+from django.utils.dateparse import parse_datetime
+from django.db.models import Q, Count, Exists, F, OuterRef, Prefetch
+from django.db.models.functions import Lower
 from django.core.paginator import Paginator
 from django.contrib.auth import get_user_model
 import logging
 
 from .models import (
-    Job, Property, Room, Topic, UserProfile, 
+    Job, JobImage, Property, Room, Topic, UserProfile, 
     PreventiveMaintenance, Machine, MaintenanceProcedure
 )
 from .optimizations import QueryOptimizer, CacheOptimizer
-from .cache_enhanced import cache_manager, cache_invalidation
+from .cache_enhanced import (
+    USER_MACHINES_GENERATION, USER_PROPERTIES_GENERATION, cache_manager, cache_invalidation
+)
 from .timezones import object_timezone
 
 logger = logging.getLogger(__name__)
@@ -77,7 +83,6 @@ class JobService:
                 
                 # Handle images
                 for image in images:
-                    from .models import JobImage
                     JobImage.objects.create(
                         job=job,
                         image=image,
@@ -94,17 +99,164 @@ class JobService:
             logger.error(f"Failed to create job: {e}")
             raise
     
+    @staticmethod
+    def create_jobs_bulk(user, jobs_data: List[Dict[str, Any]]) -> List[Job]:
+        """
+        Create several jobs at once, resolving rooms and topics in bulk.
+
+        Each entry takes the same keys as ``create_job``. Jobs are still saved
+        one by one so ``Job.save`` and its signals run; the room and topic
+        lookups and the M2M links are batched across the whole list.
+        """
+        try:
+            with transaction.atomic():
+                entries = []
+                for job_data in jobs_data:
+                    job_data = dict(job_data)
+                    topic_data = job_data.pop('topic_data', {})
+                    room_id = job_data.pop('room_id', None)
+                    images = job_data.pop('images', [])
+                    
+                    if not room_id:
+                        raise ValidationError("Room ID is required")
+                    if not topic_data.get('title'):
+                        raise ValidationError("Topic title is required")
+                    
+                    entries.append((job_data, topic_data, room_id, images))
+                
+                # Keyed by str so form values like "12" match integer pks
+                rooms = {
+                    str(pk): room
+                    for pk, room in Room.objects.in_bulk({room_id for _, _, room_id, _ in entries}).items()
+                }
+                if any(str(room_id) not in rooms for _, _, room_id, _ in entries):
+                    raise ValidationError("Invalid room ID")
+                
+                # Same semantics as get_or_create: existing topics keep their
+                # description, new ones take the first description supplied.
+                new_topics = {}
+                for _, topic_data, _, _ in entries:
+                    new_topics.setdefault(topic_data['title'], topic_data.get('description', ''))
+                topics = Topic.objects.in_bulk(list(new_topics), field_name='title')
+                Topic.objects.bulk_create(
+                    [
+                        Topic(title=title, description=description)
+                        for title, description in new_topics.items()
+                        if title not in topics
+                    ],
+                    ignore_conflicts=True,
+                )
+                topics = Topic.objects.in_bulk(list(new_topics), field_name='title')
+                
+                jobs = []
+                room_links = []
+                topic_links = []
+                for job_data, topic_data, room_id, images in entries:
+                    job = Job.objects.create(
+                        user=user,
+                        updated_by=user,
+                        **job_data
+                    )
+                    jobs.append(job)
+                    room_links.append(Job.rooms.through(job_id=job.pk, room_id=rooms[str(room_id)].pk))
+                    topic_links.append(Job.topics.through(job_id=job.pk, topic_id=topics[topic_data['title']].pk))
+                    
+                    # JobImage.save builds the JPEG derivative, so no bulk_create
+                    for image in images:
+                        JobImage.objects.create(
+                            job=job,
+                            image=image,
+                            uploaded_by=user
+                        )
+                
+                Job.rooms.through.objects.bulk_create(room_links)
+                Job.topics.through.objects.bulk_create(topic_links)
+                
+                # Invalidate cache
+                cache_invalidation.invalidate_user_related_cache(user.id)
+                
+                logger.info(f"Created {len(jobs)} jobs for user {user.username}")
+                return jobs
+                
+        except Exception as e:
+            logger.error(f"Failed to create jobs: {e}")
+            raise
+    
+    # Status counts returned by get_user_jobs
+    JOB_STAT_KEYS = ('total', 'pending', 'in_progress', 'completed', 'cancelled')
+    
     @staticmethod
     def get_user_jobs(user, filters: Dict[str, Any] = None) -> Tuple[List[Job], Dict[str, Any]]:
         """
         Get jobs for a user with filtering and pagination
+
+        With a ``cursor`` filter the stats also carry ``next_cursor``; the
+        status counts are only computed for the first page (empty cursor)
+        and are ``None`` on later pages.
         """
         filters = filters or {}
         
         # Build query
-        queryset = QueryOptimizer.get_optimized_job_queryset().filter(user=user)
+        queryset = JobService._filter_user_jobs(
+            QueryOptimizer.get_optimized_job_queryset(), user, filters
+        )
+        
+        # Pagination
+        try:
+            page_size = int(filters.get('page_size', 24))
+        except (TypeError, ValueError) as exc:
+            raise ValidationError("Invalid page_size") from exc
+        if page_size < 1:
+            raise ValidationError("Invalid page_size")
+        page_number = filters.get('page', 1)
+        
+        # Keyset pagination: seek past the last row of the previous page
+        # instead of skipping OFFSET rows. An empty cursor starts at the top;
+        # only that first page pays for the statistics aggregate.
+        if 'cursor' in filters:
+            queryset = queryset.order_by('-created_at', '-pk')
+            if filters['cursor']:
+                stats = dict.fromkeys(JobService.JOB_STAT_KEYS)
+                created_at, pk = JobService._decode_job_cursor(filters['cursor'])
+                queryset = queryset.filter(
+                    Q(created_at__lt=created_at) |
+                    Q(created_at=created_at, pk__lt=pk)
+                )
+            else:
+                stats = JobService._user_job_stats(user, filters)
+            jobs = list(queryset[:page_size + 1])
+            stats['next_cursor'] = (
+                JobService._encode_job_cursor(jobs[page_size - 1]) if len(jobs) > page_size else None
+            )
+            return jobs[:page_size], stats
+        
+        stats = JobService._user_job_stats(user, filters)
+        paginator = Paginator(queryset, page_size)
+        # The total is already known; skip the paginator's own COUNT(*).
+        paginator.count = stats['total']
+        page = paginator.get_page(page_number)
+        
+        return list(page), stats
+    
+    @staticmethod
+    def _user_job_stats(user, filters: Dict[str, Any]) -> Dict[str, Any]:
+        """Count the filtered jobs per status in one pass."""
+        # The optimized queryset is grouped by its count annotations, so
+        # aggregate over the plain filtered rows instead; distinct keeps the
+        # property join from counting a job twice.
+        return JobService._filter_user_jobs(Job.objects.all(), user, filters).aggregate(
+            total=Count('pk', distinct=True),
+            pending=Count('pk', distinct=True, filter=Q(status='pending')),
+            in_progress=Count('pk', distinct=True, filter=Q(status='in_progress')),
+            completed=Count('pk', distinct=True, filter=Q(status='completed')),
+            cancelled=Count('pk', distinct=True, filter=Q(status='cancelled')),
+        )
+    
+    @staticmethod
+    def _filter_user_jobs(queryset, user, filters: Dict[str, Any]):
+        """Apply the get_user_jobs filters to ``queryset``."""
+        queryset = queryset.filter(user=user)
         
-        # Apply filters
         if filters.get('status'):
             queryset = queryset.filter(status=filters['status'])
         
@@ -121,23 +273,20 @@ class JobService:
                 Q(job_id__icontains=search_term)
             )
         
-        # Pagination
-        page_size = filters.get('page_size', 24)
-        page_number = filters.get('page', 1)
-        
-        paginator = Paginator(queryset, page_size)
-        page = paginator.get_page(page_number)
-        
-        # Get statistics
-        stats = {
-            'total': paginator.count,
-            'pending': queryset.filter(status='pending').count(),
-            'in_progress': queryset.filter(status='in_progress').count(),
-            'completed': queryset.filter(status='completed').count(),
-            'cancelled': queryset.filter(status='cancelled').count(),
-        }
-        
-        return list(page), stats
+        return queryset
+    
+    @staticmethod
+    def _encode_job_cursor(job: Job) -> str:
+        raw = f"{job.created_at.isoformat()}|{job.pk}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+    
+    @staticmethod
+    def _decode_job_cursor(cursor: str) -> Tuple[datetime, int]:
+        try:
+            created_at, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+            return datetime.fromisoformat(created_at), int(pk)
+        except ValueError as exc:
+            raise ValidationError("Invalid cursor") from exc
     
     @staticmethod
     def update_job_status(job_id: str, status: str, user) -> Job:
@@ -198,7 +347,9 @@ class PropertyService:
                 return list(Property.objects.all())
             return list(Property.objects.filter(users=user))
         
-        return cache_manager.get_or_set(cache_key, fetch_properties, timeout=300)
+        return cache_manager.get_or_set_generation(
+            cache_key, USER_PROPERTIES_GENERATION, fetch_properties, timeout=300
+        )
     
     @staticmethod
     def get_property_rooms(property_id: str, user) -> List[Room]:
@@ -222,12 +373,20 @@ class PropertyService:
         Get property by ID with access control
         """
         try:
-            property_obj = Property.objects.get(property_id=property_id)
-            
-            # Check access
-            if not (user.is_staff or user.is_superuser):
-                if not property_obj.users.filter(id=user.id).exists():
-                    raise ValidationError("Access denied to this property")
+            if user.is_staff or user.is_superuser:
+                return Property.objects.get(property_id=property_id)
+
+            # Check access in the same query that loads the property
+            property_obj = Property.objects.annotate(
+                user_has_access=Exists(
+                    Property.users.through.objects.filter(
+                        property_id=OuterRef('pk'),
+                        user_id=user.id,
+                    )
+                )
+            ).get(property_id=property_id)
+            if not property_obj.user_has_access:
+                raise ValidationError("Access denied to this property")
             
             return property_obj
             
@@ -244,17 +403,18 @@ class PropertyService:
         cache_key = f"property_stats:{property_id}"
         
         def fetch_stats():
-            jobs = Job.objects.filter(rooms__properties=property_obj)
-            
-            return {
-                'total_jobs': jobs.count(),
-                'pending_jobs': jobs.filter(status='pending').count(),
-                'in_progress_jobs': jobs.filter(status='in_progress').count(),
-                'completed_jobs': jobs.filter(status='completed').count(),
-                'preventive_maintenance_jobs': jobs.filter(is_preventivemaintenance=True).count(),
-                'rooms_count': property_obj.rooms.count(),
-                'machines_count': property_obj.machines.count()
-            }
+            # One pass over the property's jobs; distinct so a job linked to
+            # several of its rooms is counted once.
+            stats = Job.objects.filter(rooms__properties=property_obj).aggregate(
+                total_jobs=Count('pk', distinct=True),
+                pending_jobs=Count('pk', distinct=True, filter=Q(status='pending')),
+                in_progress_jobs=Count('pk', distinct=True, filter=Q(status='in_progress')),
+                completed_jobs=Count('pk', distinct=True, filter=Q(status='completed')),
+                preventive_maintenance_jobs=Count('pk', distinct=True, filter=Q(is_preventivemaintenance=True)),
+            )
+            stats['rooms_count'] = property_obj.rooms.count()
+            stats['machines_count'] = property_obj.machines.count()
+            return stats
         
         return cache_manager.get_or_set(cache_key, fetch_stats, timeout=300)
 
@@ -312,104 +472,6 @@ class RoomGroupingService:
         return sorted_grouped
 
 
-class PreventiveMaintenanceService:
-    """
-    Service for preventive maintenance business logic
-    """
-    
-    @staticmethod
-    def create_preventive_maintenance(user, pm_data: Dict[str, Any]) -> PreventiveMaintenance:
-        """
-        Create a new preventive maintenance task
-        """
-        try:
-            with transaction.atomic():
-                # Extract related data
-                topic_ids = pm_data.pop('topic_ids', [])
-                machine_ids = pm_data.pop('machine_ids', [])
-                
-                # Create PM task
-                pm_task = PreventiveMaintenance.objects.create(
-                    created_by=user,
-                    **pm_data
-                )
-                
-                # Add relationships
-                if topic_ids:
-                    pm_task.topics.set(topic_ids)
-                
-                if machine_ids:
-                    machines = Machine.objects.filter(machine_id__in=machine_ids)
-                    pm_task.machines.set(machines)
-                
-                # Invalidate cache
-                cache_invalidation.invalidate_user_related_cache(user.id)
-                
-                logger.info(f"Created PM task {pm_task.pm_id}")
-                return pm_task
-                
-        except Exception as e:
-            logger.error(f"Failed to create PM task: {e}")
-            raise
-    
-    @staticmethod
-    def get_upcoming_maintenance(user, days: int = 30) -> List[PreventiveMaintenance]:
-        """
-        Get upcoming maintenance tasks
-        """
-        now = timezone.now()
-        end_date = now + timezone.timedelta(days=days)
-        
-        queryset = QueryOptimizer.get_optimized_preventive_maintenance_queryset().filter(
-            completed_date__isnull=True,
-            scheduled_date__gte=now,
-            scheduled_date__lte=end_date
-        ).order_by('scheduled_date')
-        
-        # Filter by user access
-        if not user.is_staff:
-            user_properties = Property.objects.filter(users=user)
-            queryset = queryset.filter(
-                Q(job__rooms__properties__in=user_properties) |
-                Q(machines__property__in=user_properties)
-            )
-        
-        return list(queryset.distinct())
-    
-    @staticmethod
-    def complete_maintenance(pm_id: str, completion_data: Dict[str, Any], user) -> PreventiveMaintenance:
-        """
-        Complete a preventive maintenance task
-        """
-        try:
-            pm_task = PreventiveMaintenance.objects.get(pm_id=pm_id)
-            
-            if pm_task.completed_date:
-                raise ValidationError("Maintenance task already completed")
-            
-            # Update completion data
-            pm_task.completed_date = completion_data.get('completed_date', timezone.now())
-            pm_task.completion_notes = completion_data.get('notes', '')
-            pm_task.completed_by = user
-            
-            # Calculate next due date
-            pm_task.calculate_next_due_date()
-            
-            pm_task.save()
-            
-            # Invalidate cache
-            cache_invalidation.invalidate_user_related_cache(user.id)
-            
-            logger.info(f"Completed PM task {pm_id}")
-            return pm_task
-            
-        except PreventiveMaintenance.DoesNotExist:
-            raise ValidationError("Maintenance task not found")
-        except Exception as e:
-            logger.error(f"Failed to complete PM task: {e}")
-            raise
-
-
 class MachineService:
     """
     Service for machine-related business logic
@@ -420,11 +482,18 @@ class MachineService:
         """
         Get machines accessible to a user
         """
-        if user.is_staff or user.is_superuser:
-            return list(Machine.objects.select_related('property').all())
+        cache_key = f"user_machines:{user.id}"
         
-        user_properties = Property.objects.filter(users=user)
-        return list(Machine.objects.filter(property__in=user_properties).select_related('property'))
+        def fetch_machines():
+            if user.is_staff or user.is_superuser:
+                return list(Machine.objects.select_related('property').all())
+            
+            user_properties = Property.objects.filter(users=user)
+            return list(Machine.objects.filter(property__in=user_properties).select_related('property'))
+        
+        return cache_manager.get_or_set_generation(
+            cache_key, USER_MACHINES_GENERATION, fetch_machines, timeout=300
+        )
     
     @staticmethod
     def create_machine(machine_data: Dict[str, Any], user) -> Machine:
@@ -522,14 +591,7 @@ class MaintenanceProcedureService:
         """
         Search procedures by required tools
         """
-        procedures = MaintenanceProcedure.objects.all()
-        matching_procedures = []
-        
-        for procedure in procedures:
-            if procedure.required_tools and tool_query.lower() in procedure.required_tools.lower():
-                matching_procedures.append(procedure)
-        
-        return matching_procedures
+        return list(MaintenanceProcedure.objects.filter(required_tools__icontains=tool_query))
 
 
 class NotificationService:
@@ -546,34 +608,51 @@ class NotificationService:
         """
         if not property_id:
             return queryset
-        return queryset.filter(
+        return queryset.filter(pk__in=PreventiveMaintenance.objects.filter(
             Q(job__rooms__properties__property_id=property_id) |
             Q(machines__property__property_id=property_id)
-        )
+        ).values('pk'))
 
     @staticmethod
-    def get_overdue_maintenance(user, property_id: Optional[str] = None) -> List[PreventiveMaintenance]:
+    def _filter_by_access(queryset, user):
         """
-        Get overdue maintenance tasks, optionally scoped to a single property.
+        Scope a preventive maintenance queryset to the properties a non-staff
+        user belongs to. Like _filter_by_property, the M2M joins run in a pk
+        subquery, so the annotated outer query gains no joins and needs no
+        distinct().
         """
-        now = timezone.now()
+        if user.is_staff:
+            return queryset
+        user_properties = Property.objects.filter(users=user)
+        return queryset.filter(pk__in=PreventiveMaintenance.objects.filter(
+            Q(job__rooms__properties__in=user_properties) |
+            Q(machines__property__in=user_properties)
+        ).values('pk'))
 
+    @staticmethod
+    def open_tasks(user, property_id: Optional[str] = None, **scheduled_range):
+        """
+        Uncompleted tasks the user can see, ordered by schedule. Callers pass
+        the ``scheduled_date`` bounds of the window they need; shared with
+        ``PreventiveMaintenanceService.get_upcoming_maintenance``.
+        """
         queryset = QueryOptimizer.get_optimized_preventive_maintenance_queryset().filter(
             completed_date__isnull=True,
-            scheduled_date__lt=now
+            **scheduled_range
         ).order_by('scheduled_date')
 
-        # Filter by user access
-        if not user.is_staff:
-            user_properties = Property.objects.filter(users=user)
-            queryset = queryset.filter(
-                Q(job__rooms__properties__in=user_properties) |
-                Q(machines__property__in=user_properties)
-            )
+        queryset = NotificationService._filter_by_access(queryset, user)
 
-        queryset = NotificationService._filter_by_property(queryset, property_id)
+        return NotificationService._filter_by_property(queryset, property_id)
 
-        return list(queryset.distinct())
+    @staticmethod
+    def get_overdue_maintenance(user, property_id: Optional[str] = None) -> List[PreventiveMaintenance]:
+        """
+        Get overdue maintenance tasks, optionally scoped to a single property.
+        """
+        return list(NotificationService.open_tasks(
+            user, property_id, scheduled_date__lt=timezone.now(),
+        ))
 
     @staticmethod
     def get_upcoming_alerts(user, days: int = 7, property_id: Optional[str] = None) -> List[PreventiveMaintenance]:
@@ -582,25 +661,10 @@ class NotificationService:
         single property.
         """
         now = timezone.now()
-        end_date = now + timezone.timedelta(days=days)
 
-        queryset = QueryOptimizer.get_optimized_preventive_maintenance_queryset().filter(
-            completed_date__isnull=True,
-            scheduled_date__gte=now,
-            scheduled_date__lte=end_date
-        ).order_by('scheduled_date')
-
-        # Filter by user access
-        if not user.is_staff:
-            user_properties = Property.objects.filter(users=user)
-            queryset = queryset.filter(
-                Q(job__rooms__properties__in=user_properties) |
-                Q(machines__property__in=user_properties)
-            )
-
-        queryset = NotificationService._filter_by_property(queryset, property_id)
-
-        return list(queryset.distinct())
+        return list(NotificationService.open_tasks(
+            user, property_id, scheduled_date__gte=now, scheduled_date__lte=now + timedelta(days=days),
+        ))
 
     @staticmethod
     def normalize_days(days: Any, default: int = 7, minimum: int = 1) -> int:
@@ -623,11 +687,15 @@ class NotificationService:
         scoped to a single property.
         """
         normalized_days = NotificationService.normalize_days(days)
-        overdue_tasks = NotificationService.get_overdue_maintenance(user, property_id=property_id)
-        upcoming_tasks = NotificationService.get_upcoming_alerts(
-            user, days=normalized_days, property_id=property_id
-        )
-        all_tasks = list(overdue_tasks) + list(upcoming_tasks)
+        now = timezone.now()
+
+        # Overdue and upcoming tasks form one contiguous window, so fetch it
+        # once and split on the current time.
+        all_tasks = list(NotificationService.open_tasks(
+            user, property_id, scheduled_date__lte=now + timedelta(days=normalized_days),
+        ))
+        overdue_tasks = [task for task in all_tasks if task.scheduled_date < now]
+        upcoming_tasks = [task for task in all_tasks if task.scheduled_date >= now]
 
         return {
             'overdue_tasks': overdue_tasks,
@@ -642,7 +710,7 @@ class NotificationService:
 
 class PreventiveMaintenanceService:
     """
-    Service for preventive maintenance import, status changes, and scheduling.
+    Service for preventive maintenance tasks, import, status changes, and scheduling.
     """
 
     STATUS_MAP = {
@@ -677,19 +745,118 @@ class PreventiveMaintenanceService:
         'cancelled': set(),
     }
 
+    # relativedelta clamps to the last day of shorter months (Jan 31 + 1
+    # month is Feb 28/29) and moves Feb 29 to Feb 28 in non-leap years.
+    FREQUENCY_STEPS = {
+        'daily': relativedelta(days=1),
+        'weekly': relativedelta(weeks=1),
+        'monthly': relativedelta(months=1),
+        'quarterly': relativedelta(months=3),
+        'semi_annual': relativedelta(months=6),
+        'annual': relativedelta(years=1),
+    }
+
+    IMPORT_BATCH_SIZE = 1000
+    # Rows parsed, resolved and written together; bounds memory on large files.
+    IMPORT_CHUNK_SIZE = 2000
+
+    @staticmethod
+    def create_preventive_maintenance(user, pm_data: Dict[str, Any]) -> PreventiveMaintenance:
+        """
+        Create a new preventive maintenance task
+        """
+        try:
+            with transaction.atomic():
+                # Extract related data
+                topic_ids = pm_data.pop('topic_ids', [])
+                machine_ids = pm_data.pop('machine_ids', [])
+                
+                # Create PM task
+                pm_task = PreventiveMaintenance.objects.create(
+                    created_by=user,
+                    **pm_data
+                )
+                
+                # Add relationships
+                if topic_ids:
+                    pm_task.topics.set(topic_ids)
+                
+                if machine_ids:
+                    # .set() takes pks; no need to hydrate Machine rows
+                    machine_pks = Machine.objects.filter(
+                        machine_id__in=machine_ids
+                    ).values_list('pk', flat=True)
+                    pm_task.machines.set(list(machine_pks))
+                
+                # Invalidate cache
+                cache_invalidation.invalidate_user_related_cache(user.id)
+                
+                logger.info(f"Created PM task {pm_task.pm_id}")
+                return pm_task
+                
+        except Exception as e:
+            logger.error(f"Failed to create PM task: {e}")
+            raise
+    
+    @staticmethod
+    def get_upcoming_maintenance(user, days: int = 30) -> List[PreventiveMaintenance]:
+        """
+        Get upcoming maintenance tasks
+        """
+        now = timezone.now()
+        
+        return list(NotificationService.open_tasks(
+            user, scheduled_date__gte=now, scheduled_date__lte=now + timedelta(days=days),
+        ))
+    
+    @staticmethod
+    def complete_maintenance(pm_id: str, completion_data: Dict[str, Any], user) -> PreventiveMaintenance:
+        """
+        Complete a preventive maintenance task
+        """
+        try:
+            pm_task = PreventiveMaintenance.objects.get(pm_id=pm_id)
+            
+            if pm_task.completed_date:
+                raise ValidationError("Maintenance task already completed")
+            
+            # Update completion data
+            pm_task.completed_date = completion_data.get('completed_date', timezone.now())
+            pm_task.completion_notes = completion_data.get('notes', '')
+            pm_task.completed_by = user
+            
+            # Calculate next due date
+            pm_task.calculate_next_due_date()
+            
+            pm_task.save()
+            
+            # Invalidate cache
+            cache_invalidation.invalidate_user_related_cache(user.id)
+            
+            logger.info(f"Completed PM task {pm_id}")
+            return pm_task
+            
+        except PreventiveMaintenance.DoesNotExist:
+            raise ValidationError("Maintenance task not found")
+        except Exception as e:
+            logger.error(f"Failed to complete PM task: {e}")
+            raise
+
     @staticmethod
     def normalize_status(value: Optional[str]) -> Optional[str]:
         if value is None:
             return None
-        normalized = str(value).strip().lower()
-        return PreventiveMaintenanceService.STATUS_MAP.get(normalized)
+        if not isinstance(value, str):
+            value = str(value)
+        return PreventiveMaintenanceService.STATUS_MAP.get(value.strip().lower())
 
     @staticmethod
     def normalize_frequency(value: Optional[str]) -> Optional[str]:
         if value is None:
             return None
-        normalized = str(value).strip().lower()
-        return PreventiveMaintenanceService.FREQUENCY_MAP.get(normalized)
+        if not isinstance(value, str):
+            value = str(value)
+        return PreventiveMaintenanceService.FREQUENCY_MAP.get(value.strip().lower())
 
     @staticmethod
     def parse_datetime_value(value: Any, field_name: str, tzinfo=None) -> datetime:
@@ -699,8 +866,6 @@ class PreventiveMaintenanceService:
         if isinstance(value, datetime):
             parsed = value
         else:
-            from django.utils.dateparse import parse_datetime
-
             parsed = parse_datetime(str(value).strip())
 
         if not parsed:
@@ -724,40 +889,13 @@ class PreventiveMaintenanceService:
         if timezone.is_naive(base_date):
             base_date = timezone.make_aware(base_date, tzinfo or timezone.get_default_timezone())
 
-        if frequency == 'daily':
-            return base_date + timezone.timedelta(days=1)
-        if frequency == 'weekly':
-            return base_date + timezone.timedelta(weeks=1)
-        if frequency == 'monthly':
-            month = base_date.month + 1
-            year = base_date.year
-            if month > 12:
-                month = 1
-                year += 1
-            day = min(base_date.day, monthrange(year, month)[1])
-            return base_date.replace(year=year, month=month, day=day)
-        if frequency == 'quarterly':
-            month = base_date.month + 3
-            year = base_date.year
-            if month > 12:
-                month -= 12
-                year += 1
-            day = min(base_date.day, monthrange(year, month)[1])
-            return base_date.replace(year=year, month=month, day=day)
-        if frequency == 'semi_annual':
-            month = base_date.month + 6
-            year = base_date.year
-            if month > 12:
-                month -= 12
-                year += 1
-            day = min(base_date.day, monthrange(year, month)[1])
-            return base_date.replace(year=year, month=month, day=day)
-        if frequency == 'annual':
-            return base_date.replace(year=base_date.year + 1)
+        step = PreventiveMaintenanceService.FREQUENCY_STEPS.get(frequency)
+        if step is not None:
+            return base_date + step
         if frequency == 'custom':
             if not custom_days or custom_days <= 0:
                 raise ValidationError("Custom days must be greater than zero for custom frequency")
-            return base_date + timezone.timedelta(days=custom_days)
+            return base_date + timedelta(days=custom_days)
 
         raise ValidationError(f"Unsupported frequency: {frequency}")
 
@@ -870,8 +1008,8 @@ class PreventiveMaintenanceService:
             else:
                 raise
 
-        next_task.topics.set(maintenance.topics.all())
-        next_task.machines.set(maintenance.machines.all())
+        next_task.topics.set(list(maintenance.topics.values_list('pk', flat=True)))
+        next_task.machines.set(list(maintenance.machines.values_list('pk', flat=True)))
 
         logger.info(
             "Created next preventive maintenance occurrence %s from %s",
@@ -893,29 +1031,82 @@ class PreventiveMaintenanceService:
             'errors': [],
         }
 
-        for row_index, row in enumerate(reader, start=2):
+        row_index = 2
+        while True:
+            rows = list(islice(reader, PreventiveMaintenanceService.IMPORT_CHUNK_SIZE))
+            if not rows:
+                break
+            PreventiveMaintenanceService._import_chunk(rows, row_index, default_user, results)
+            row_index += len(rows)
+
+        return results
+
+    @staticmethod
+    def _import_chunk(
+        rows: List[Dict[str, Any]],
+        first_row_index: int,
+        default_user,
+        results: Dict[str, Any],
+    ) -> None:
+        """Validate and write one chunk of CSV rows, accumulating into ``results``."""
+        lookups = PreventiveMaintenanceService._build_import_lookups(rows)
+
+        # Validate every row first so the writes can be batched; a row that
+        # fails validation is reported and skipped, as before.
+        plans = []
+        for row_index, row in enumerate(rows, start=first_row_index):
             try:
-                with transaction.atomic():
-                    created = PreventiveMaintenanceService.upsert_from_row(row, default_user)
-                if created:
-                    results['created'] += 1
-                else:
-                    results['updated'] += 1
+                plan = PreventiveMaintenanceService._plan_row(row, default_user, lookups)
             except ValidationError as exc:
                 results['errors'].append({
                     'row': row_index,
                     'error': str(exc),
                 })
+                continue
             except Exception as exc:  # noqa: BLE001 - capture unexpected import errors
                 results['errors'].append({
                     'row': row_index,
                     'error': f"Unexpected error: {exc}",
                 })
+                continue
+            plan['row'] = row_index
+            plans.append(plan)
 
-        return results
+        if not plans:
+            return
+
+        try:
+            created, updated = PreventiveMaintenanceService._apply_import_plans(plans)
+        except Exception:  # noqa: BLE001 - retry row by row to pin the failure
+            # A database error in the batch rolls all of it back; replay the
+            # rows one at a time so only the offending ones are reported.
+            created = updated = 0
+            for plan in plans:
+                try:
+                    row_created, row_updated = PreventiveMaintenanceService._apply_import_plans([plan])
+                except Exception as exc:  # noqa: BLE001 - capture unexpected import errors
+                    results['errors'].append({
+                        'row': plan['row'],
+                        'error': f"Unexpected error: {exc}",
+                    })
+                    continue
+                created += row_created
+                updated += row_updated
+            results['errors'].sort(key=lambda error: error['row'])
+
+        results['created'] += created
+        results['updated'] += updated
 
     @staticmethod
     def upsert_from_row(row: Dict[str, Any], default_user) -> bool:
+        lookups = PreventiveMaintenanceService._build_import_lookups([row])
+        plan = PreventiveMaintenanceService._plan_row(row, default_user, lookups)
+        created, _ = PreventiveMaintenanceService._apply_import_plans([plan])
+        return bool(created)
+
+    @staticmethod
+    def _plan_row(row: Dict[str, Any], default_user, lookups: Dict[str, Dict]) -> Dict[str, Any]:
+        """Validate one CSV row into the field values and relations to write."""
         pm_id = str(row.get('PM ID', '')).strip()
         if not pm_id:
             raise ValidationError("PM ID is required for import")
@@ -962,60 +1153,140 @@ class PreventiveMaintenanceService:
         )
 
         assigned_to = PreventiveMaintenanceService._find_user(
+            lookups,
             row.get('Assigned Email'),
             row.get('Assigned To'),
         )
 
         created_by = PreventiveMaintenanceService._find_user(
+            lookups,
             row.get('Creator Email'),
             row.get('Created By'),
         ) or default_user
 
         procedure_template = PreventiveMaintenanceService._find_procedure_template(
+            lookups,
             row.get('Task Template'),
         )
 
-        existing = PreventiveMaintenance.objects.filter(pm_id__iexact=pm_id).first()
-
-        defaults = {
-            'pmtitle': row.get('Title') or 'No title',
-            'scheduled_date': scheduled_date,
-            'completed_date': completed_date if status_value == 'completed' else None,
-            'status': status_value,
-            'frequency': frequency,
-            'custom_days': custom_days,
-            'next_due_date': next_due_date,
-            'notes': row.get('Notes') or None,
-            'procedure': row.get('Procedure') or None,
-            'procedure_template': procedure_template,
-            'assigned_to': assigned_to,
-            'created_by': created_by,
+        return {
+            'pm_id': pm_id,
+            'defaults': {
+                'pmtitle': row.get('Title') or 'No title',
+                'scheduled_date': scheduled_date,
+                'completed_date': completed_date if status_value == 'completed' else None,
+                'status': status_value,
+                'frequency': frequency,
+                'custom_days': custom_days,
+                'next_due_date': next_due_date,
+                'notes': row.get('Notes') or None,
+                'procedure': row.get('Procedure') or None,
+                'procedure_template': procedure_template,
+                'assigned_to': assigned_to,
+                'created_by': created_by,
+            },
+            'topics': PreventiveMaintenanceService._parse_list_values(row.get('Topics')),
+            'machines': PreventiveMaintenanceService._parse_list_values(row.get('Machines')),
         }
 
-        if existing:
-            for field_name, value in defaults.items():
-                setattr(existing, field_name, value)
-            existing.save()
-            maintenance = existing
-            created = False
-        else:
-            maintenance = PreventiveMaintenance.objects.create(pm_id=pm_id, **defaults)
-            created = True
+    @staticmethod
+    def _apply_import_plans(plans: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """Write validated import rows with batched queries.
+
+        Rows are matched to existing records on ``pm_id`` case-insensitively.
+        A ``pm_id`` repeated in the file updates the record an earlier row
+        created, and the last row's values win, exactly as sequential upserts
+        would. Returns ``(created, updated)`` row counts.
+        """
+        batch_size = PreventiveMaintenanceService.IMPORT_BATCH_SIZE
+        update_fields = list(plans[0]['defaults']) + ['updated_at']
+
+        with transaction.atomic():
+            existing = {
+                maintenance.pm_id.lower(): maintenance
+                for maintenance in PreventiveMaintenance.objects.annotate(
+                    pm_id_lower=Lower('pm_id'),
+                ).filter(pm_id_lower__in={plan['pm_id'].lower() for plan in plans})
+            }
+
+            new_records = {}
+            created = updated = 0
+            targets = []
+            for plan in plans:
+                key = plan['pm_id'].lower()
+                maintenance = existing.get(key) or new_records.get(key)
+                if maintenance is None:
+                    maintenance = PreventiveMaintenance(pm_id=plan['pm_id'], **plan['defaults'])
+                    new_records[key] = maintenance
+                    created += 1
+                else:
+                    for field_name, value in plan['defaults'].items():
+                        setattr(maintenance, field_name, value)
+                    updated += 1
+                targets.append((maintenance, plan))
+
+            PreventiveMaintenance.objects.bulk_create(new_records.values(), batch_size=batch_size)
+            if existing:
+                # bulk_update skips auto_now, so stamp updated_at ourselves
+                now = timezone.now()
+                for maintenance in existing.values():
+                    maintenance.updated_at = now
+                PreventiveMaintenance.objects.bulk_update(
+                    existing.values(), update_fields, batch_size=batch_size,
+                )
 
-        topics = PreventiveMaintenanceService._parse_list_values(row.get('Topics'))
-        machines = PreventiveMaintenanceService._parse_list_values(row.get('Machines'))
+            topic_names = {name for _, plan in targets for name in plan['topics'] or ()}
+            topic_pks = dict(Topic.objects.filter(title__in=topic_names).values_list('title', 'pk'))
+            missing_topics = [Topic(title=name) for name in topic_names if name not in topic_pks]
+            if missing_topics:
+                # Another import may add the same title meanwhile; skip those
+                # rows and read every id back, since ignored rows get no pk.
+                Topic.objects.bulk_create(missing_topics, batch_size=batch_size, ignore_conflicts=True)
+                topic_pks.update(
+                    Topic.objects.filter(
+                        title__in=[topic.title for topic in missing_topics],
+                    ).values_list('title', 'pk')
+                )
 
-        if topics is not None:
-            topic_ids = []
-            for topic_name in topics:
-                topic_obj, _ = Topic.objects.get_or_create(title=topic_name)
-                topic_ids.append(topic_obj.id)
-            maintenance.topics.set(topic_ids)
+            machine_ids = {machine_id for _, plan in targets for machine_id in plan['machines'] or ()}
+            machine_pks = dict(
+                Machine.objects.filter(machine_id__in=machine_ids).values_list('machine_id', 'pk')
+            )
+
+            # Later rows for the same record replace earlier ones, like .set()
+            topic_links = {}
+            machine_links = {}
+            for maintenance, plan in targets:
+                if plan['topics'] is not None:
+                    topic_links[maintenance.pk] = [topic_pks[name] for name in plan['topics']]
+                if plan['machines'] is not None:
+                    machine_links[maintenance.pk] = [
+                        machine_pks[machine_id] for machine_id in plan['machines'] if machine_id in machine_pks
+                    ]
+
+            PreventiveMaintenanceService._replace_links(
+                PreventiveMaintenance.topics.through, 'topic_id', topic_links,
+            )
+            PreventiveMaintenanceService._replace_links(
+                PreventiveMaintenance.machines.through, 'machine_id', machine_links,
+            )
 
-        if machines is not None:
-            maintenance.machines.set(Machine.objects.filter(machine_id__in=machines))
+        return created, updated
 
-        return created
+    @staticmethod
+    def _replace_links(through, target_field: str, links: Dict[int, List[int]]) -> None:
+        """Equivalent of ``.set()`` for many records in two queries."""
+        if not links:
+            return
+        through.objects.filter(preventivemaintenance_id__in=list(links)).delete()
+        through.objects.bulk_create(
+            [
+                through(preventivemaintenance_id=pm_pk, **{target_field: target_pk})
+                for pm_pk, target_pks in links.items()
+                for target_pk in dict.fromkeys(target_pks)
+            ],
+            batch_size=PreventiveMaintenanceService.IMPORT_BATCH_SIZE,
+        )
 
     @staticmethod
     def _parse_list_values(value: Any) -> Optional[List[str]]:
@@ -1034,26 +1305,78 @@ class PreventiveMaintenanceService:
         return [raw]
 
     @staticmethod
-    def _find_user(email_value: Any, username_value: Any):
-        if email_value:
-            user = User.objects.filter(email__iexact=str(email_value).strip()).first()
-            if user:
-                return user
+    def _lookup_key(value: Any) -> str:
+        return str(value).strip().lower() if value else ''
 
-        if username_value:
-            user = User.objects.filter(username__iexact=str(username_value).strip()).first()
-            if user:
-                return user
+    @staticmethod
+    def _build_import_lookups(rows: List[Dict[str, Any]]) -> Dict[str, Dict]:
+        """Resolve every user and task template the rows reference up front.
 
-        return None
+        One query per model replaces the per-row ``iexact`` lookups. Matches
+        keep ``.first()`` semantics: the lowest pk wins for users, the
+        model's default ordering for templates.
+        """
+        key = PreventiveMaintenanceService._lookup_key
+        emails = {key(row.get(column)) for row in rows for column in ('Assigned Email', 'Creator Email')}
+        usernames = {key(row.get(column)) for row in rows for column in ('Assigned To', 'Created By')}
+        emails.discard('')
+        usernames.discard('')
+
+        users_by_email = {}
+        users_by_username = {}
+        if emails or usernames:
+            users = User.objects.annotate(
+                email_key=Lower('email'),
+                username_key=Lower('username'),
+            ).filter(Q(email_key__in=emails) | Q(username_key__in=usernames)).order_by('pk')
+            for user in users:
+                if user.email_key in emails:
+                    users_by_email.setdefault(user.email_key, user)
+                if user.username_key in usernames:
+                    users_by_username.setdefault(user.username_key, user)
+
+        template_ids = set()
+        template_names = set()
+        for row in rows:
+            raw = key(row.get('Task Template'))
+            if raw.isdigit():
+                template_ids.add(int(raw))
+            elif raw:
+                template_names.add(raw)
+
+        templates_by_id = {}
+        templates_by_name = {}
+        if template_ids or template_names:
+            templates = MaintenanceProcedure.objects.annotate(
+                name_key=Lower('name'),
+            ).filter(Q(id__in=template_ids) | Q(name_key__in=template_names))
+            for template in templates:
+                templates_by_id[template.id] = template
+                if template.name_key in template_names:
+                    templates_by_name.setdefault(template.name_key, template)
+
+        return {
+            'users_by_email': users_by_email,
+            'users_by_username': users_by_username,
+            'templates_by_id': templates_by_id,
+            'templates_by_name': templates_by_name,
+        }
 
     @staticmethod
-    def _find_procedure_template(value: Any):
-        if not value:
+    def _find_user(lookups: Dict[str, Dict], email_value: Any, username_value: Any):
+        key = PreventiveMaintenanceService._lookup_key
+        return (
+            lookups['users_by_email'].get(key(email_value))
+            or lookups['users_by_username'].get(key(username_value))
+        )
+
+    @staticmethod
+    def _find_procedure_template(lookups: Dict[str, Dict], value: Any):
+        raw = PreventiveMaintenanceService._lookup_key(value)
+        if not raw:
             return None
 
-        raw = str(value).strip()
         if raw.isdigit():
-            return MaintenanceProcedure.objects.filter(id=int(raw)).first()
+            return lookups['templates_by_id'].get(int(raw))
 
-        return MaintenanceProcedure.objects.filter(name__iexact=raw).first()
+        return lookups['templates_by_name'].get(raw)
@@ -80,11 +80,10 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD', 'postgres'),
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '5432'),
-        'OPTIONS': {
-            'MAX_CONNS': 20,
-            'MIN_CONNS': 5,
-            'CONN_MAX_AGE': 600,  # 10 minutes connection pooling
-        },
+        # Persistent connections are a top-level setting; OPTIONS is passed
+        # to psycopg as connection arguments and rejects unknown keys.
+        'CONN_MAX_AGE': 600,  # 10 minutes connection pooling
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -1,9 +1,12 @@
 from django.contrib.admin.sites import AdminSite
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
-from .admin import IsDefectFilter, JobAdmin, _excel_image_for_export
-from .models import Job, Room
+from .admin import InventoryAdmin, IsDefectFilter, JobAdmin, PropertyAdmin, _excel_image_for_export
+from .models import Inventory, Job, PreventiveMaintenance, Property, Room
 
 
 User = get_user_model()
@@ -261,3 +264,85 @@ class JobAdminCsvExportTests(TestCase):
         row = next(workbook.active.iter_rows(min_row=2, max_row=2, values_only=True))
         self.assertEqual(row[16], 'Embedded below')
         self.assertEqual(row[17], self.request.build_absolute_uri(image.image.url))
+
+
+class InventoryAdminQueryTests(TestCase):
+    def setUp(self):
+        self.request = RequestFactory().get('/admin/myappLubd/inventory/')
+        self.admin = InventoryAdmin(Inventory, AdminSite())
+        self.user = User.objects.create_user(username='pdf-engineer', password='pw12345!')
+
+    def _add_item(self, name):
+        item = Inventory.objects.create(name=name, quantity=3, unit='pcs', created_by=self.user)
+        for suffix in ('a', 'b'):
+            item.jobs.add(Job.objects.create(
+                user=self.user,
+                description=f'{name} job {suffix}',
+                remarks='',
+                status='pending',
+                priority='medium',
+            ))
+            item.preventive_maintenances.add(PreventiveMaintenance.objects.create(
+                pmtitle=f'{name} PM {suffix}',
+                created_by=self.user,
+                scheduled_date=timezone.now(),
+            ))
+        return item
+
+    def _export_query_count(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.admin.export_inventory_pdf(self.request, Inventory.objects.all())
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        return len(ctx.captured_queries)
+
+    def test_export_query_count_does_not_grow_with_items(self):
+        self._add_item('Fuse')
+        baseline = self._export_query_count()
+
+        self._add_item('Relay')
+        self._add_item('Contactor')
+
+        self.assertEqual(self._export_query_count(), baseline)
+
+    def test_last_by_user_columns_read_prefetched_rows(self):
+        item = self._add_item('Fuse')
+        self.request.user = self.user
+        latest_job = item.jobs.order_by('-updated_at').first()
+        latest_pm = item.preventive_maintenances.order_by('-updated_at').first()
+
+        row = self.admin.get_queryset(self.request).get(pk=item.pk)
+        with CaptureQueriesContext(connection) as ctx:
+            job_cell = self.admin.last_job_by_user(row)
+            pm_cell = self.admin.last_pm_by_user(row)
+
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertIn(latest_job.job_id, job_cell)
+        self.assertIn(latest_pm.pm_id, pm_cell)
+
+
+class PropertyAdminExportTests(TestCase):
+    def setUp(self):
+        self.request = RequestFactory().get('/admin/myappLubd/property/')
+        self.admin = PropertyAdmin(Property, AdminSite())
+
+    def _add_property(self, name):
+        prop = Property.objects.create(name=name)
+        prop.users.add(User.objects.create_user(username=f'{name}-user', email=f'{name}@example.com', password='pw12345!'))
+        return prop
+
+    def _export(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.admin.export_properties_csv(self.request, Property.objects.all())
+        return response.content.decode('utf-8-sig'), len(ctx.captured_queries)
+
+    def test_csv_export_streams_with_prefetched_users(self):
+        self._add_property('alpha')
+        _, baseline = self._export()
+
+        self._add_property('beta')
+        self._add_property('gamma')
+        content, queries = self._export()
+
+        self.assertEqual(queries, baseline)
+        self.assertIn('gamma-user (gamma@example.com)', content)
+        self.assertEqual(len(content.strip().splitlines()), 4)
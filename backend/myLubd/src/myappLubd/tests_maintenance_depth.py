@@ -1,21 +1,42 @@
+import json
 from datetime import timedelta
+from unittest import mock
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIClient
 
+from .cache_enhanced import cache_invalidation
 from .models import (
     Inventory,
     InventoryUsage,
     Job,
     Machine,
+    MaintenanceProcedure,
     MaintenanceChecklist,
     PreventiveMaintenance,
     Property,
     Room,
+    Topic,
+    UtilityConsumption,
 )
+from .serializers import (
+    InventoryListSerializer,
+    PreventiveMaintenanceCompleteSerializer,
+    PreventiveMaintenanceSerializer,
+    TopicSerializer,
+    UtilityConsumptionListSerializer,
+    _resolve_machine_ids,
+)
+from .services import JobService, MachineService, NotificationService, PropertyService
 
 
 User = get_user_model()
@@ -136,3 +157,450 @@ class MaintenanceDepthTests(TestCase):
         self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST, resp.content)
         self.inventory.refresh_from_db()
         self.assertEqual(self.inventory.quantity, 5)
+
+    def test_pm_list_query_count_does_not_grow_with_rows(self):
+        self._login()
+
+        def add_pm(**extra):
+            pm = PreventiveMaintenance.objects.create(
+                pmtitle='FCU check',
+                scheduled_date=timezone.now(),
+                created_by=self.user,
+                **extra,
+            )
+            pm.machines.add(self.machine)
+            return pm
+
+        def list_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                resp = self.client.get('/api/v1/preventive-maintenance/')
+            self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.content)
+            return len(ctx.captured_queries), resp.json()['results']
+
+        add_pm(job=self.job)
+        add_pm()
+        baseline, _ = list_queries()
+        add_pm(job=self.job)
+        add_pm()
+        queries, results = list_queries()
+
+        self.assertEqual(queries, baseline)
+        self.assertEqual(len(results), 4)
+        for row in results:
+            self.assertEqual(row['property_id'], [self.prop.property_id])
+            self.assertEqual([m['machine_id'] for m in row['machines']], [self.machine.machine_id])
+
+    def test_pm_many_render_resolves_property_ids_in_one_query(self):
+        with_machine = PreventiveMaintenance.objects.create(
+            pmtitle='FCU check', scheduled_date=timezone.now(), created_by=self.user,
+        )
+        with_machine.machines.add(self.machine)
+        without_machine = PreventiveMaintenance.objects.create(
+            pmtitle='Walkthrough', scheduled_date=timezone.now(), created_by=self.user,
+        )
+
+        serializer = PreventiveMaintenanceCompleteSerializer(
+            [PreventiveMaintenance.objects.get(pk=with_machine.pk),
+             PreventiveMaintenance.objects.get(pk=without_machine.pk)],
+            many=True,
+        )
+        rows = serializer.data
+
+        self.assertEqual(serializer.property_map, {with_machine.pk: self.prop.property_id})
+        self.assertEqual(rows[0]['property_id'], self.prop.property_id)
+        self.assertIsNone(rows[1]['property_id'])
+
+        prefetched = PreventiveMaintenanceCompleteSerializer.setup_eager_loading(
+            PreventiveMaintenance.objects.filter(pk=with_machine.pk)
+        )
+        serializer = PreventiveMaintenanceCompleteSerializer(prefetched, many=True)
+        self.assertEqual(serializer.data[0]['property_id'], self.prop.property_id)
+        self.assertEqual(serializer.property_map, {})
+
+    def test_pm_many_render_topics_match_topic_serializer(self):
+        pm = PreventiveMaintenance.objects.create(
+            pmtitle='FCU check', scheduled_date=timezone.now(), created_by=self.user,
+        )
+        topics = [Topic.objects.create(title='Filters'), Topic.objects.create(title='Coils', description='Wash')]
+        pm.topics.set(topics)
+        expected = TopicSerializer(Topic.objects.filter(pk__in=[t.pk for t in topics]), many=True).data
+
+        many_rows = PreventiveMaintenanceSerializer([pm], many=True).data
+        single = PreventiveMaintenanceSerializer(PreventiveMaintenance.objects.get(pk=pm.pk)).data
+
+        self.assertEqual(many_rows[0]['topics'], expected)
+        self.assertEqual(single['topics'], expected)
+
+    def test_machine_ids_validation_runs_one_query(self):
+        other_prop = Property.objects.create(name='Hotel Other')
+        other_machine = Machine.objects.create(name='Chiller', category='HVAC', property=other_prop)
+        ids = [self.machine.machine_id, other_machine.machine_id]
+
+        with self.assertNumQueries(1):
+            machine_pks, error = _resolve_machine_ids(ids)
+        self.assertIsNone(machine_pks)
+        self.assertEqual(error, 'All machines must belong to the same property.')
+
+        with self.assertNumQueries(1):
+            machine_pks, error = _resolve_machine_ids([self.machine.machine_id] * 2)
+        self.assertIsNone(error)
+        self.assertEqual(machine_pks, [self.machine.pk])
+
+    def test_utility_list_fast_path_matches_serializer_output(self):
+        self.user.is_staff = True
+        self.user.save(update_fields=['is_staff'])
+        self._login()
+        UtilityConsumption.objects.create(property=self.prop, month=1, year=2024, totalkwh='1200.50', water='3')
+        UtilityConsumption.objects.create(month=2, year=2024, nightsale='10')
+
+        resp = self.client.get('/api/v1/utility-consumption/')
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.content)
+        expected = UtilityConsumptionListSerializer(
+            UtilityConsumption.objects.order_by('-year', '-month'), many=True
+        ).data
+        self.assertEqual(resp.json()['results'], json.loads(JSONRenderer().render(expected)))
+        self.assertNotIn('property_id', resp.json()['results'][0])
+
+    def test_procedure_list_query_count_does_not_grow_with_rows(self):
+        self._login()
+
+        def add_procedure(name):
+            procedure = MaintenanceProcedure.objects.create(name=name)
+            procedure.machines.add(self.machine)
+            PreventiveMaintenance.objects.create(
+                pmtitle=name, scheduled_date=timezone.now(), created_by=self.user, procedure_template=procedure,
+            )
+
+        def list_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                resp = self.client.get('/api/v1/maintenance-procedures/')
+            self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.content)
+            return len(ctx.captured_queries), resp.json()['results']
+
+        add_procedure('Filter clean')
+        baseline, _ = list_queries()
+        add_procedure('Coil wash')
+        add_procedure('Belt check')
+        queries, results = list_queries()
+
+        self.assertEqual(queries, baseline)
+        self.assertEqual(len(results), 3)
+        for row in results:
+            self.assertEqual(row['machine_ids'], [self.machine.machine_id])
+            self.assertEqual(row['schedule_count'], 1)
+
+    def test_procedure_search_by_tools_matches_case_insensitively(self):
+        self._login()
+        for name, tools in (('Coil wash', 'Fin comb, Pressure Washer'), ('Belt check', 'Tension gauge'), ('Survey', None)):
+            procedure = MaintenanceProcedure.objects.create(name=name, required_tools=tools)
+            procedure.machines.add(self.machine)
+
+        resp = self.client.get('/api/v1/maintenance-procedures/search_by_tools/', {'tool': 'pressure washer'})
+
+        self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.content)
+        self.assertEqual([row['name'] for row in resp.json()['data']], ['Coil wash'])
+
+    def test_user_jobs_pages_with_the_aggregate_total(self):
+        for index in range(3):
+            job = Job.objects.create(
+                user=self.user,
+                description=f'Extra job {index}',
+                remarks='',
+                status='completed',
+                priority='low',
+            )
+            job.rooms.set([self.room])
+
+        with CaptureQueriesContext(connection) as ctx:
+            jobs, stats = JobService.get_user_jobs(
+                self.user, {'property_id': self.prop.property_id, 'page_size': 2, 'page': 2},
+            )
+
+        self.assertEqual(stats['total'], 4)
+        self.assertEqual((stats['pending'], stats['completed']), (1, 3))
+        self.assertEqual(len(jobs), 2)
+        self.assertFalse(any('COUNT(*)' in query['sql'] for query in ctx.captured_queries))
+
+    def test_create_jobs_bulk_links_rooms_and_topics(self):
+        Topic.objects.create(title='Electrical', description='Existing')
+        second_room = Room.objects.create(name='D-102', room_type='Standard')
+
+        jobs = JobService.create_jobs_bulk(self.user, [
+            {'description': 'Lamp out', 'remarks': '', 'room_id': self.room.room_id,
+             'topic_data': {'title': 'Electrical', 'description': 'Ignored'}},
+            {'description': 'Tap drips', 'remarks': '', 'room_id': str(second_room.room_id),
+             'topic_data': {'title': 'Plumbing', 'description': 'Water'}},
+            {'description': 'Socket loose', 'remarks': '', 'room_id': second_room.room_id,
+             'topic_data': {'title': 'Electrical'}},
+        ])
+
+        self.assertEqual(
+            [(list(job.rooms.all()), [t.title for t in job.topics.all()]) for job in jobs],
+            [([self.room], ['Electrical']), ([second_room], ['Plumbing']), ([second_room], ['Electrical'])],
+        )
+        self.assertEqual(Topic.objects.get(title='Electrical').description, 'Existing')
+        self.assertEqual(Topic.objects.get(title='Plumbing').description, 'Water')
+
+    def test_create_jobs_bulk_rejects_unknown_rooms(self):
+        with self.assertRaisesMessage(ValidationError, 'Invalid room ID'):
+            JobService.create_jobs_bulk(self.user, [
+                {'description': 'Ghost', 'remarks': '', 'room_id': 999999, 'topic_data': {'title': 'Ghost'}},
+            ])
+        self.assertFalse(Topic.objects.filter(title='Ghost').exists())
+
+    def test_user_cache_invalidation_deletes_keys_in_one_call(self):
+        cache.set(f'user_machines:{self.user.id}', ['stale'])
+        cache.set(f'user_properties:{self.user.id}', ['stale'])
+
+        with mock.patch.object(cache, 'delete_many', wraps=cache.delete_many) as delete_many:
+            cache_invalidation.invalidate_user_related_cache(self.user.id)
+
+        delete_many.assert_called_once()
+        self.assertIsNone(cache.get(f'user_machines:{self.user.id}'))
+        self.assertIsNone(cache.get(f'user_properties:{self.user.id}'))
+
+    def test_property_stats_count_each_job_once(self):
+        second_room = Room.objects.create(name='D-102', room_type='Standard')
+        second_room.properties.add(self.prop)
+        self.job.rooms.add(second_room)
+        Job.objects.create(
+            user=self.user, description='Done', remarks='', status='completed', priority='low',
+        ).rooms.set([self.room])
+
+        with self.assertNumQueries(4):
+            stats = PropertyService.get_property_stats(self.prop.property_id, self.user)
+
+        self.assertEqual(
+            (stats['total_jobs'], stats['pending_jobs'], stats['completed_jobs'], stats['in_progress_jobs']),
+            (2, 1, 1, 0),
+        )
+        self.assertEqual((stats['rooms_count'], stats['machines_count']), (2, 1))
+
+    def test_user_jobs_cursor_walks_every_job_once(self):
+        tied = timezone.now() - timedelta(days=1)
+        for index in range(4):
+            Job.objects.create(
+                user=self.user,
+                description=f'Cursor job {index}',
+                remarks='',
+                status='pending',
+                priority='low',
+                created_at=tied if index < 2 else tied - timedelta(hours=index),
+            )
+        expected = list(Job.objects.filter(user=self.user).order_by('-created_at', '-pk'))
+
+        jobs, first_stats = JobService.get_user_jobs(self.user, {'cursor': '', 'page_size': 2})
+        seen, cursor = list(jobs), first_stats['next_cursor']
+        while cursor is not None:
+            with CaptureQueriesContext(connection) as ctx:
+                jobs, stats = JobService.get_user_jobs(self.user, {'cursor': cursor, 'page_size': 2})
+            self.assertFalse([q for q in ctx.captured_queries if 'AS "total"' in q['sql']])
+            seen.extend(jobs)
+            cursor = stats['next_cursor']
+
+        self.assertEqual(seen, expected)
+        self.assertEqual(first_stats['total'], 5)
+        self.assertEqual(set(stats), set(first_stats))
+        self.assertIsNone(stats['total'])
+        with self.assertRaisesMessage(ValidationError, 'Invalid cursor'):
+            JobService.get_user_jobs(self.user, {'cursor': 'not-a-cursor'})
+        with self.assertRaisesMessage(ValidationError, 'Invalid page_size'):
+            JobService.get_user_jobs(self.user, {'cursor': '', 'page_size': 0})
+
+    def test_overdue_tasks_are_listed_once_across_multiple_links(self):
+        second_room = Room.objects.create(name='D-102', room_type='Standard')
+        second_room.properties.add(self.prop)
+        self.job.rooms.add(second_room)
+        other_machine = Machine.objects.create(name='Pump', property=self.prop)
+        pm = PreventiveMaintenance.objects.create(
+            pmtitle='Linked twice',
+            job=self.job,
+            scheduled_date=timezone.now() - timedelta(days=2),
+            created_by=self.user,
+        )
+        pm.machines.set([self.machine, other_machine])
+        outsider = User.objects.create_user(username='outsider', password='pw12345!')
+
+        overdue = NotificationService.get_overdue_maintenance(self.user, property_id=self.prop.property_id)
+
+        self.assertEqual(overdue, [pm])
+        self.assertEqual(overdue[0].machines_count, 2)
+        self.assertEqual(NotificationService.get_overdue_maintenance(outsider), [])
+        self.assertEqual(NotificationService.get_overdue_maintenance(self.user, property_id='missing'), [])
+
+    def test_all_notifications_fetch_both_windows_in_one_pass(self):
+        now = timezone.now()
+        for title, offset in (('Late', -3), ('Soon', 2), ('Later', 5), ('Far', 30)):
+            PreventiveMaintenance.objects.create(
+                pmtitle=title,
+                job=self.job,
+                scheduled_date=now + timedelta(days=offset),
+                created_by=self.user,
+            )
+
+        with CaptureQueriesContext(connection) as overdue_ctx:
+            NotificationService.get_overdue_maintenance(self.user)
+        with CaptureQueriesContext(connection) as all_ctx:
+            payload = NotificationService.get_all_notifications(self.user, days=7)
+
+        self.assertEqual([task.pmtitle for task in payload['overdue_tasks']], ['Late'])
+        self.assertEqual([task.pmtitle for task in payload['upcoming_tasks']], ['Soon', 'Later'])
+        self.assertEqual([task.pmtitle for task in payload['all_tasks']], ['Late', 'Soon', 'Later'])
+        self.assertEqual((payload['overdue_count'], payload['upcoming_count'], payload['total_count']), (1, 2, 3))
+        self.assertEqual(len(all_ctx.captured_queries), len(overdue_ctx.captured_queries))
+
+    def test_property_access_is_checked_in_one_query(self):
+        outsider = User.objects.create_user(username='outsider', password='pw12345!')
+
+        with self.assertNumQueries(1):
+            self.assertEqual(PropertyService.get_property_by_id(self.prop.property_id, self.user), self.prop)
+        with self.assertRaisesMessage(ValidationError, 'Access denied'):
+            PropertyService.get_property_by_id(self.prop.property_id, outsider)
+        with self.assertRaisesMessage(ValidationError, 'Property not found'):
+            PropertyService.get_property_by_id('missing', self.user)
+
+    def test_notifications_query_count_does_not_grow_with_rows(self):
+        self._login()
+        template = MaintenanceProcedure.objects.create(name='Coil wash')
+
+        def add_overdue(name):
+            tech = User.objects.create_user(username=f'tech-{name}', password='pw12345!')
+            pm = PreventiveMaintenance.objects.create(
+                pmtitle=name,
+                scheduled_date=timezone.now() - timedelta(days=1),
+                created_by=tech,
+                assigned_to=tech,
+                procedure_template=template,
+            )
+            pm.machines.add(self.machine)
+
+        def notification_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                resp = self.client.get('/api/v1/notifications/all/')
+            self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.content)
+            return len(ctx.captured_queries), resp.json()
+
+        add_overdue('first')
+        baseline, _ = notification_queries()
+        add_overdue('second')
+        add_overdue('third')
+        queries, data = notification_queries()
+
+        self.assertEqual(queries, baseline)
+        self.assertEqual(data['overdue_count'], 3)
+        self.assertEqual({row['procedure_template_name'] for row in data['results']}, {'Coil wash'})
+
+    def test_inventory_detail_query_count_does_not_grow_with_usage_records(self):
+        self._login()
+        url = f'/api/v1/inventory/{self.inventory.item_id}/'
+        self.inventory.jobs.add(self.job)
+
+        def add_usage():
+            InventoryUsage.objects.create(
+                inventory=self.inventory, job=self.job, property=self.prop, quantity=1, consumed_by=self.user,
+            )
+
+        def detail_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                resp = self.client.get(url)
+            self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.content)
+            return len(ctx.captured_queries), resp.json()
+
+        add_usage()
+        baseline, _ = detail_queries()
+        add_usage()
+        add_usage()
+        queries, data = detail_queries()
+
+        self.assertEqual(queries, baseline)
+        self.assertEqual(len(data['usage_records']), 3)
+        self.assertEqual(data['usage_records'][0]['inventory_item_id'], self.inventory.item_id)
+        self.assertEqual(data['usage_records'][0]['job_id'], self.job.job_id)
+
+    def test_inventory_list_reads_related_rows_from_prefetch(self):
+        self._login()
+        pm = PreventiveMaintenance.objects.create(
+            pmtitle='Driver swap',
+            scheduled_date=timezone.now(),
+            created_by=self.user,
+        )
+
+        def add_item(name, linked=True):
+            item = Inventory.objects.create(
+                name=name, category='parts', quantity=5, min_quantity=1, unit='pcs', property=self.prop,
+            )
+            if linked:
+                item.jobs.add(self.job)
+                item.preventive_maintenances.add(pm)
+
+        def list_queries():
+            with CaptureQueriesContext(connection) as ctx:
+                resp = self.client.get('/api/v1/inventory/')
+            self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.content)
+            return len(ctx.captured_queries), resp.json()['results']
+
+        add_item('Ballast')
+        baseline, _ = list_queries()
+        add_item('Starter')
+        add_item('Lamp holder')
+        add_item('Spare fuse', linked=False)
+        queries, results = list_queries()
+
+        self.assertEqual(queries, baseline)
+        row = next(r for r in results if r['name'] == 'Starter')
+        self.assertEqual(row['job_ids'], [self.job.job_id])
+        self.assertEqual(row['pm_ids'], [pm.pm_id])
+        self.assertEqual(row['job_id'], self.job.job_id)
+        self.assertEqual(row['pm_title'], pm.pmtitle)
+        self.assertEqual(row['jobs_detail'], [
+            {'job_id': self.job.job_id, 'description': self.job.description, 'status': self.job.status},
+        ])
+        self.assertEqual(row['last_job_by_user']['job_id'], self.job.job_id)
+        self.assertEqual(row['last_pm_by_user']['pm_id'], pm.pm_id)
+        spare = next(r for r in results if r['name'] == 'Spare fuse')
+        self.assertIsNone(spare['last_job_by_user'])
+        self.assertIsNone(spare['last_pm_by_user'])
+
+    def test_inventory_last_by_user_is_none_for_anonymous_requests(self):
+        unassigned = PreventiveMaintenance.objects.create(
+            pmtitle='Unassigned check',
+            scheduled_date=timezone.now(),
+            created_by=self.user,
+        )
+        self.inventory.preventive_maintenances.add(unassigned)
+        request = RequestFactory().get('/api/v1/inventory/')
+        request.user = AnonymousUser()
+
+        data = InventoryListSerializer(self.inventory, context={'request': request}).data
+
+        self.assertEqual(data['pm_ids'], [unassigned.pm_id])
+        self.assertIsNone(data['last_job_by_user'])
+        self.assertIsNone(data['last_pm_by_user'])
+
+    def test_property_change_invalidates_every_user_property_list(self):
+        colleague = User.objects.create_user(username='colleague', password='pw12345!')
+        self.prop.users.add(colleague)
+        self.assertEqual(PropertyService.get_user_properties(colleague), [self.prop])
+
+        Property.objects.filter(pk=self.prop.pk).update(name='Hotel Depth Renamed')
+        cache_invalidation.invalidate_property_related_cache(self.prop.property_id)
+
+        with self.assertNumQueries(1):
+            properties = PropertyService.get_user_properties(colleague)
+        self.assertEqual([prop.name for prop in properties], ['Hotel Depth Renamed'])
+
+    def test_property_change_invalidates_every_user_machine_list(self):
+        colleague = User.objects.create_user(username='colleague', password='pw12345!')
+        self.prop.users.add(colleague)
+        self.assertEqual(MachineService.get_user_machines(self.user), [self.machine])
+        self.assertEqual(MachineService.get_user_machines(colleague), [self.machine])
+
+        added = MachineService.create_machine(
+            {'name': 'Chiller', 'property': self.prop.property_id}, self.user,
+        )
+
+        with self.assertNumQueries(1):
+            self.assertCountEqual(MachineService.get_user_machines(colleague), [self.machine, added])
+        with self.assertNumQueries(0):
+            self.assertCountEqual(MachineService.get_user_machines(colleague), [self.machine, added])
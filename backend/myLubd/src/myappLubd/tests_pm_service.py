@@ -0,0 +1,184 @@
+"""Tests for the preventive maintenance service: scheduling and CSV import."""
+
+from datetime import datetime, timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from .models import Machine, MaintenanceProcedure, PreventiveMaintenance, Property, Topic
+from .services import PreventiveMaintenanceService
+
+
+User = get_user_model()
+
+HEADER = (
+    'PM ID,Title,Scheduled Date,Completed Date,Status,Frequency,Custom Days,'
+    'Assigned Email,Creator Email,Task Template,Topics,Machines\n'
+)
+
+
+class NextDueDateTests(TestCase):
+    def _next(self, frequency, base, custom_days=None):
+        return PreventiveMaintenanceService.calculate_next_due_date(
+            frequency, custom_days, timezone.make_aware(base),
+        ).replace(tzinfo=None)
+
+    def test_month_steps_clamp_to_month_end(self):
+        self.assertEqual(self._next('monthly', datetime(2026, 1, 31, 9)), datetime(2026, 2, 28, 9))
+        self.assertEqual(self._next('quarterly', datetime(2026, 11, 30, 9)), datetime(2027, 2, 28, 9))
+        self.assertEqual(self._next('semi_annual', datetime(2026, 8, 31, 9)), datetime(2027, 2, 28, 9))
+
+    def test_annual_step_from_leap_day(self):
+        self.assertEqual(self._next('annual', datetime(2028, 2, 29, 9)), datetime(2029, 2, 28, 9))
+
+    def test_fixed_and_custom_steps(self):
+        self.assertEqual(self._next('weekly', datetime(2026, 12, 28, 9)), datetime(2027, 1, 4, 9))
+        self.assertEqual(self._next('custom', datetime(2026, 1, 1, 9), custom_days=10), datetime(2026, 1, 11, 9))
+        with self.assertRaises(ValidationError):
+            self._next('custom', datetime(2026, 1, 1, 9))
+        with self.assertRaises(ValidationError):
+            self._next('fortnightly', datetime(2026, 1, 1, 9))
+
+
+class PreventiveMaintenanceTaskTests(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user(username='planner', password='pw12345!', is_staff=True)
+        self.machine = Machine.objects.create(name='Boiler', property=Property.objects.create(name='Hotel Tasks'))
+
+    def test_create_and_list_upcoming_tasks(self):
+        pm = PreventiveMaintenanceService.create_preventive_maintenance(self.staff, {
+            'pmtitle': 'Boiler descale',
+            'scheduled_date': timezone.now() + timedelta(days=3),
+            'machine_ids': [self.machine.machine_id],
+        })
+
+        self.assertEqual(list(pm.machines.all()), [self.machine])
+        self.assertEqual(PreventiveMaintenanceService.get_upcoming_maintenance(self.staff, days=7), [pm])
+        self.assertEqual(PreventiveMaintenanceService.get_upcoming_maintenance(self.staff, days=1), [])
+
+
+class PreventiveMaintenanceCsvImportTests(TestCase):
+    def setUp(self):
+        self.importer = User.objects.create_user(username='importer', password='pw12345!')
+        self.tech = User.objects.create_user(username='tech', email='tech@example.com', password='pw12345!')
+        self.prop = Property.objects.create(name='Hotel Import')
+        self.machine = Machine.objects.create(name='Chiller', property=self.prop)
+        self.template = MaintenanceProcedure.objects.create(name='Chiller service')
+        Topic.objects.create(title='HVAC')
+
+    def _import(self, body):
+        return PreventiveMaintenanceService.import_from_csv_content(HEADER + body, self.importer)
+
+    def test_creates_rows_with_relations(self):
+        result = self._import(
+            f'PMA1,Chiller check,2026-01-31 09:00,,Scheduled,monthly,,tech@example.com,,'
+            f'Chiller service,HVAC;Water,{self.machine.machine_id}\n'
+        )
+
+        self.assertEqual(result, {'created': 1, 'updated': 0, 'errors': []})
+        pm = PreventiveMaintenance.objects.get(pm_id='PMA1')
+        self.assertEqual(pm.pmtitle, 'Chiller check')
+        self.assertEqual(pm.status, 'pending')
+        self.assertEqual(pm.assigned_to, self.tech)
+        self.assertEqual(pm.created_by, self.importer)
+        self.assertEqual(pm.procedure_template, self.template)
+        self.assertEqual((pm.next_due_date.month, pm.next_due_date.day), (2, 28))
+        self.assertEqual(sorted(pm.topics.values_list('title', flat=True)), ['HVAC', 'Water'])
+        self.assertEqual(list(pm.machines.all()), [self.machine])
+
+    def test_updates_existing_rows_case_insensitively(self):
+        existing = PreventiveMaintenance.objects.create(
+            pm_id='PMB2', pmtitle='Old', scheduled_date=timezone.now(), created_by=self.importer,
+        )
+        existing.topics.add(Topic.objects.get(title='HVAC'))
+
+        result = self._import('pmb2,New title,2026-03-01 08:00,,in progress,weekly,,,,,,\n')
+
+        self.assertEqual(result, {'created': 0, 'updated': 1, 'errors': []})
+        existing.refresh_from_db()
+        self.assertEqual(existing.pmtitle, 'New title')
+        self.assertEqual(existing.status, 'in_progress')
+        self.assertEqual(existing.frequency, 'weekly')
+        self.assertEqual(list(existing.topics.all()), [])
+        self.assertEqual(PreventiveMaintenance.objects.count(), 1)
+
+    def test_invalid_rows_are_reported_and_valid_rows_kept(self):
+        result = self._import(
+            'PMC1,Good,2026-01-01 08:00,,pending,monthly,,,,,,\n'
+            ',Missing id,2026-01-01 08:00,,pending,monthly,,,,,,\n'
+            'PMC3,Bad frequency,2026-01-01 08:00,,pending,fortnightly,,,,,,\n'
+            'PMC4,Bad date,not a date,,pending,monthly,,,,,,\n'
+        )
+
+        self.assertEqual(result['created'], 1)
+        self.assertEqual([error['row'] for error in result['errors']], [3, 4, 5])
+        self.assertEqual(list(PreventiveMaintenance.objects.values_list('pm_id', flat=True)), ['PMC1'])
+
+    def test_repeated_pm_id_updates_the_row_created_earlier_in_the_file(self):
+        result = self._import(
+            'PMD1,First,2026-01-01 08:00,,pending,monthly,,,,,HVAC,\n'
+            'PMD1,Second,2026-01-02 08:00,,pending,monthly,,,,,,\n'
+        )
+
+        self.assertEqual(result, {'created': 1, 'updated': 1, 'errors': []})
+        pm = PreventiveMaintenance.objects.get(pm_id='PMD1')
+        self.assertEqual(pm.pmtitle, 'Second')
+        self.assertEqual(list(pm.topics.values_list('title', flat=True)), [])
+
+    def test_chunked_import_reports_rows_across_chunks(self):
+        body = (
+            'PMC1,First,2026-01-01 08:00,,pending,monthly,,,,,,\n'
+            'PMC2,Bad,not-a-date,,pending,monthly,,,,,,\n'
+            'PMC3,Third,2026-01-01 08:00,,pending,monthly,,,,,,\n'
+            'pmc1,First again,2026-02-01 08:00,,pending,monthly,,,,,,\n'
+            ',No id,2026-01-01 08:00,,pending,monthly,,,,,,\n'
+        )
+        with mock.patch.object(PreventiveMaintenanceService, 'IMPORT_CHUNK_SIZE', 2):
+            result = self._import(body)
+
+        self.assertEqual((result['created'], result['updated']), (2, 1))
+        self.assertEqual([error['row'] for error in result['errors']], [3, 6])
+        self.assertEqual(PreventiveMaintenance.objects.get(pm_id='PMC1').pmtitle, 'First again')
+
+    def test_topic_bulk_insert_ignores_existing_titles(self):
+        with mock.patch.object(
+            Topic.objects, 'bulk_create', wraps=Topic.objects.bulk_create,
+        ) as bulk_create:
+            result = self._import('PMT1,Topics,2026-01-01 08:00,,pending,monthly,,,,,HVAC;Electrical,\n')
+
+        self.assertEqual(result['errors'], [])
+        self.assertTrue(bulk_create.call_args.kwargs['ignore_conflicts'])
+        self.assertEqual(
+            sorted(PreventiveMaintenance.objects.get(pm_id='PMT1').topics.values_list('title', flat=True)),
+            ['Electrical', 'HVAC'],
+        )
+
+    def test_import_query_count_does_not_grow_with_rows(self):
+        PreventiveMaintenance.objects.create(pm_id='PME0', scheduled_date=timezone.now(), created_by=self.importer)
+
+        def import_queries(start, count):
+            body = ''.join(
+                f'PME{index},Row {index},2026-01-01 08:00,,pending,monthly,,TECH@example.com,importer,'
+                f'{"chiller service" if index % 2 else self.template.id},HVAC;Row {index},'
+                f'{self.machine.machine_id}\n'
+                for index in range(start, start + count)
+            )
+            with CaptureQueriesContext(connection) as ctx:
+                result = self._import(body)
+            self.assertEqual(result['errors'], [])
+            return len(ctx.captured_queries)
+
+        baseline = import_queries(0, 2)
+        self.assertEqual(import_queries(0, 20), baseline)
+        self.assertEqual(PreventiveMaintenance.objects.filter(machines=self.machine).count(), 20)
+        self.assertEqual(
+            PreventiveMaintenance.objects.filter(
+                assigned_to=self.tech, procedure_template=self.template,
+            ).count(),
+            20,
+        )
@@ -0,0 +1,93 @@
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+from rest_framework import serializers
+
+from .models import Topic
+from .serializers import (
+    CachedUserPKField,
+    TopicSerializer,
+    UserSummarySerializer,
+    _absolute_uri,
+    _build_media_absolute_uri,
+)
+
+
+User = get_user_model()
+
+
+class SerializerCacheMixinTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='tech', email='tech@example.com', password='pw12345!')
+        self.topic = Topic.objects.create(title='Aircon', description='')
+
+    def test_repeated_instance_is_serialized_once_per_context(self):
+        context = {}
+        first = TopicSerializer(self.topic, context=context).data
+        self.topic.title = 'Renamed in memory'
+        second = TopicSerializer(self.topic, context=context).data
+
+        self.assertEqual(first['title'], 'Aircon')
+        self.assertEqual(second['title'], 'Aircon')
+
+    def test_cache_does_not_leak_across_contexts(self):
+        TopicSerializer(self.topic, context={}).data
+        self.topic.title = 'Renamed'
+        data = TopicSerializer(self.topic, context={}).data
+
+        self.assertEqual(data['title'], 'Renamed')
+
+    def test_callers_cannot_mutate_cached_entry(self):
+        context = {}
+        data = UserSummarySerializer(self.user, context=context).data
+        data['username'] = 'tampered'
+
+        again = UserSummarySerializer(self.user, context=context).data
+        self.assertEqual(again['username'], 'tech')
+
+    def test_many_shares_cache_between_rows(self):
+        context = {}
+        data = TopicSerializer([self.topic, self.topic], many=True, context=context).data
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual(len(context['_representation_cache']), 1)
+
+
+class CachedUserPKFieldTests(TestCase):
+    def test_resolves_each_user_once_per_context(self):
+        user = User.objects.create_user(username='assignee', password='pw12345!')
+
+        class AssignSerializer(serializers.Serializer):
+            assigned_to = CachedUserPKField()
+
+        rows = [{'assigned_to': user.pk}, {'assigned_to': str(user.pk)}, {'assigned_to': user.pk}]
+        serializer = AssignSerializer(data=rows, many=True)
+        with self.assertNumQueries(1):
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual([row['assigned_to'] for row in serializer.validated_data], [user] * 3)
+
+    def test_unknown_pk_is_still_rejected(self):
+        field = CachedUserPKField()
+        field.bind('assigned_to', serializers.Serializer())
+        with self.assertRaises(serializers.ValidationError):
+            field.to_internal_value(999999)
+
+
+class AbsoluteURITests(TestCase):
+    def test_matches_build_absolute_uri_and_caches_prefix(self):
+        request = RequestFactory().get('/api/v1/preventive-maintenance/', HTTP_HOST='testserver')
+        context = {'request': request}
+
+        for path in ('/media/pm/before.jpg', '/media/a%20b.png', 'https://cdn.example.com/x.jpg'):
+            self.assertEqual(_absolute_uri(context, path), request.build_absolute_uri(path))
+        self.assertEqual(context['_url_prefix'], 'http://testserver')
+
+    def test_media_paths_use_cached_prefix(self):
+        request = RequestFactory().get('/api/v1/jobs/', HTTP_HOST='testserver')
+        context = {'request': request}
+
+        self.assertEqual(
+            _build_media_absolute_uri(context, 'maintenance_job_images/2024/01/a b.jpg'),
+            request.build_absolute_uri('/media/maintenance_job_images/2024/01/a b.jpg'),
+        )
+        self.assertEqual(context['_url_prefix'], 'http://testserver')
+        self.assertEqual(_build_media_absolute_uri({}, '/media/x.jpg'), '/media/x.jpg')
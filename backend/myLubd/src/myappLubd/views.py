@@ -27,7 +27,7 @@ from django.urls import reverse
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from .serializers import (
     UserProfileSerializer, PropertySerializer, RoomSerializer, TopicSerializer, JobSerializer,
-    UserSerializer, PreventiveMaintenanceSerializer, PreventiveMaintenanceCreateUpdateSerializer,
+    UserCreateSerializer, PreventiveMaintenanceSerializer, PreventiveMaintenanceCreateUpdateSerializer,
     PreventiveMaintenanceCompleteSerializer, PreventiveMaintenanceListSerializer,
     PreventiveMaintenanceDetailSerializer, PropertyPMStatusSerializer,
     MachineSerializer, MachineListSerializer, MachineDetailSerializer,
@@ -1601,6 +1601,15 @@ class PreventiveMaintenanceViewSet(viewsets.ModelViewSet):
     ordering_fields = ['scheduled_date', 'created_at', 'frequency']
     ordering = ['-scheduled_date']
     permission_classes = [IsAuthenticated]
+    # Actions that render rows with PreventiveMaintenanceListSerializer
+    LIST_ACTIONS = ('list', 'stats', 'upcoming', 'schedule', 'overdue', 'by_priority')
+    # Actions whose response is rendered with PreventiveMaintenanceDetailSerializer
+    DETAIL_RESPONSE_ACTIONS = ('complete', 'change_status', 'upload_images', 'reschedule')
+    # Columns PreventiveMaintenanceListSerializer never reads
+    LIST_DEFERRED_FIELDS = (
+        'completion_notes', 'before_image_jpeg_path', 'after_image_jpeg_path',
+        'quality_score', 'verification_date', 'estimated_duration', 'actual_duration',
+    )
 
     def list(self, request, *args, **kwargs):
         """
@@ -1609,22 +1618,24 @@ class PreventiveMaintenanceViewSet(viewsets.ModelViewSet):
         """
         page_param = request.query_params.get('page')
         page_size_param = request.query_params.get('page_size')
-        logger.info(f"[PM List] Pagination params - page: {page_param}, page_size: {page_size_param}")
-        logger.info(f"[PM List] All query params: {dict(request.query_params)}")
+        logger.info("[PM List] Pagination params - page: %s, page_size: %s", page_param, page_size_param)
+        logger.debug("[PM List] All query params: %s", request.query_params)
         
         queryset = self.filter_queryset(self.get_queryset())
-        logger.info(f"[PM List] Filtered queryset count: {queryset.count()}")
+        # COUNT(*) is diagnostic only; the paginator runs its own
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[PM List] Filtered queryset count: %s", queryset.count())
         
         # Apply pagination
         page = self.paginate_queryset(queryset)
         if page is not None:
-            logger.info(f"[PM List] Pagination applied - page size: {len(page)}")
+            logger.info("[PM List] Pagination applied - page size: %s", len(page))
             serializer = self.get_serializer(page, many=True)
             return self.get_paginated_response(serializer.data)
         
         # If pagination is not applied, return all results (shouldn't happen with page param)
-        logger.warning(f"[PM List] Pagination not applied - returning all {queryset.count()} results")
         serializer = self.get_serializer(queryset, many=True)
+        logger.warning("[PM List] Pagination not applied - returning all %s results", len(serializer.data))
         return Response({
             'count': len(serializer.data),
             'results': serializer.data,
@@ -1648,7 +1659,6 @@ class PreventiveMaintenanceViewSet(viewsets.ModelViewSet):
         obj = queryset.filter(pm_id__iexact=pm_id).first()
         
         if obj is None:
-            from django.http import Http404
             raise Http404(f"No PreventiveMaintenance matches the given query with PM ID: {pm_id}")
         
         # May raise a permission denied
@@ -1665,21 +1675,15 @@ class PreventiveMaintenanceViewSet(viewsets.ModelViewSet):
         - date_from & date_to
         - pm_id (exact match)
         """
-        # ✅ PERFORMANCE: Optimize query with select_related and prefetch_related
-        queryset = PreventiveMaintenance.objects.select_related(
-            'job',  # Foreign key
-            'created_by',  # Foreign key
-            'completed_by',  # Foreign key
-            'verified_by',  # Foreign key
-            'assigned_to',  # Foreign key
-            'procedure_template',  # Foreign key
-        ).prefetch_related(
-            'topics',  # Many-to-many
-            'machines',  # Many-to-many
-            'machines__property',  # Related property through machines
-            'job__rooms',  # Rooms through job
-            'job__rooms__properties',  # Properties through rooms
-        )
+        # ✅ PERFORMANCE: eager loading is declared on the serializer that renders
+        # this action, so the prefetch set cannot drift from its nested fields
+        if self.action in self.DETAIL_RESPONSE_ACTIONS:
+            response_serializer = PreventiveMaintenanceDetailSerializer
+        else:
+            response_serializer = self.get_serializer_class()
+        queryset = response_serializer.setup_eager_loading(PreventiveMaintenance.objects.all())
+        if self.action == 'list':
+            queryset = queryset.defer(*self.LIST_DEFERRED_FIELDS)
 
         pm_id = self.request.query_params.get('pm_id')
         status_param = self.request.query_params.get('status')
@@ -1689,31 +1693,34 @@ class PreventiveMaintenanceViewSet(viewsets.ModelViewSet):
         property_filter = self.request.query_params.get('property_id')
         machine_filter = self.request.query_params.get('machine_id')
 
-        logger.info(f"[PM Filter] User: {self.request.user.username}, property_filter: {property_filter}, machine_filter: {machine_filter}")
+        logger.info("[PM Filter] User: %s, property_filter: %s, machine_filter: %s",
+                    self.request.user.username, property_filter, machine_filter)
+        log_counts = logger.isEnabledFor(logging.DEBUG)
 
         # Restrict by user's accessible properties unless staff/admin
         user = self.request.user
         if not (user.is_staff or user.is_superuser):
             # Limit to PMs whose jobs are in rooms belonging to user's properties OR via machines' property
             accessible_property_ids = Property.objects.filter(users=user).values_list('id', flat=True)
-            logger.info(f"[PM Filter] Non-admin user - accessible properties: {list(accessible_property_ids)}")
             queryset = queryset.filter(
                 Q(job__rooms__properties__in=accessible_property_ids)
                 |
                 Q(machines__property__in=accessible_property_ids)
             )
-            logger.info(f"[PM Filter] After permission filter: {queryset.count()} records")
+            if log_counts:
+                logger.debug("[PM Filter] Non-admin user - accessible properties: %s", list(accessible_property_ids))
+                logger.debug("[PM Filter] After permission filter: %s records", queryset.count())
 
         if property_filter:
-            logger.info(f"[PM Filter] Applying property filter: {property_filter}")
-            before_count = queryset.count()
+            logger.info("[PM Filter] Applying property filter: %s", property_filter)
+            before_count = queryset.count() if log_counts else None
             queryset = queryset.filter(
                 Q(job__rooms__properties__property_id=property_filter)
                 |
                 Q(machines__property__property_id=property_filter)
             )
-            after_count = queryset.count()
-            logger.info(f"[PM Filter] Property filter result: {before_count} -> {after_count} records")
+            if log_counts:
+                logger.debug("[PM Filter] Property filter result: %s -> %s records", before_count, queryset.count())
 
         if machine_filter:
             queryset = queryset.filter(machines__machine_id=machine_filter)
@@ -1743,7 +1750,7 @@ class PreventiveMaintenanceViewSet(viewsets.ModelViewSet):
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
-        if self.action == 'list':
+        if self.action in self.LIST_ACTIONS:
             return PreventiveMaintenanceListSerializer
         elif self.action in ['create', 'update', 'partial_update']:
             return PreventiveMaintenanceCreateUpdateSerializer
@@ -1811,6 +1818,8 @@ class PreventiveMaintenanceViewSet(viewsets.ModelViewSet):
         """Add the current user as the creator when creating a record, logging machine associations"""
         self._log_machine_id_state(action="create_start")
         instance = serializer.save(created_by=self.request.user)
+        # The response re-renders topics/machines; load them in two queries
+        serializer.prefetch_instances([instance])
         self._log_machine_id_state(action="create_complete", instance=instance)
         return instance
 
@@ -2131,11 +2140,12 @@ class PreventiveMaintenanceViewSet(viewsets.ModelViewSet):
         Uses calendar-aware calculations for monthly/quarterly/annual frequencies.
         """
         frequency = instance.frequency
-        logger.info(f"[PM Complete] Calculating next due date for PM {instance.pm_id}: frequency={frequency}, reference_date={reference_date}")
+        logger.info("[PM Complete] Calculating next due date for PM %s: frequency=%s, reference_date=%s",
+                    instance.pm_id, frequency, reference_date)
         
         if frequency == 'custom' and instance.custom_days:
             next_date = reference_date + timedelta(days=instance.custom_days)
-            logger.info(f"[PM Complete] Custom frequency: {instance.custom_days} days -> next_date={next_date}")
+            logger.info("[PM Complete] Custom frequency: %s days -> next_date=%s", instance.custom_days, next_date)
             return next_date
         
         if frequency == 'daily':
@@ -2185,7 +2195,8 @@ class PreventiveMaintenanceViewSet(viewsets.ModelViewSet):
             day = min(reference_date.day, monthrange(year, month)[1])
             next_date = reference_date.replace(year=year, month=month, day=day)
         
-        logger.info(f"[PM Complete] Calculated next scheduled date: {next_date} (from {reference_date} with frequency {frequency})")
+        logger.info("[PM Complete] Calculated next scheduled date: %s (from %s with frequency %s)",
+                    next_date, reference_date, frequency)
         return next_date
 
     @action(detail=True, methods=['post'])
@@ -2543,7 +2554,11 @@ class MaintenanceProcedureViewSet(viewsets.ModelViewSet):
         Return all maintenance procedures for all users (they are shared templates).
         However, only admin users can create/update/delete them.
         """
-        return MaintenanceProcedure.objects.prefetch_related('machines').all()
+        queryset = MaintenanceProcedure.objects.prefetch_related('machines')
+        if self.action == 'list':
+            # Only MaintenanceProcedureListSerializer reads schedule_count
+            queryset = queryset.annotate(schedule_count=Count('maintenance_schedules'))
+        return queryset
 
     def perform_create(self, serializer):
         """Only admin users can create procedures"""
@@ -2731,13 +2746,10 @@ class MaintenanceProcedureViewSet(viewsets.ModelViewSet):
                 'error': 'tool query parameter is required'
             }, status=400)
         
-        queryset = self.get_queryset()
-        # Search in required_tools field
-        matching_procedures = []
-        
-        for procedure in queryset:
-            if procedure.required_tools and tool_query.lower() in procedure.required_tools.lower():
-                matching_procedures.append(MaintenanceProcedureListSerializer(procedure).data)
+        # Search in required_tools field; the database does the matching
+        matches = self.get_queryset().filter(required_tools__icontains=tool_query)
+        # One serializer for all matches instead of a field tree per row
+        matching_procedures = MaintenanceProcedureListSerializer(matches, many=True).data
         
         return Response({
             'success': True,
@@ -4525,7 +4537,7 @@ class PropertyViewSet(viewsets.ModelViewSet):
 
 class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
-    serializer_class = UserSerializer
+    serializer_class = UserCreateSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
@@ -4609,7 +4621,7 @@ class RegisterView(APIView):
 
     def post(self, request):
         logger.debug(f"Register request payload: {request.data}")
-        serializer = UserSerializer(data=request.data)
+        serializer = UserCreateSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()
             refresh = RefreshToken.for_user(user)
@@ -5611,6 +5623,15 @@ class UtilityConsumptionViewSet(viewsets.ModelViewSet):
         if self.action == 'list':
             return UtilityConsumptionListSerializer
         return UtilityConsumptionSerializer
+
+    def list(self, request, *args, **kwargs):
+        """List records from plain column values via ``serialize_bulk``."""
+        serializer_class = self.get_serializer_class()
+        rows = serializer_class.bulk_values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serializer_class.serialize_bulk(page))
+        return Response(serializer_class.serialize_bulk(rows))
     
     def perform_create(self, serializer):
         """Add the current user as the creator when creating a record"""
@@ -5641,13 +5662,35 @@ class InventoryViewSet(viewsets.ModelViewSet):
         Return inventory items filtered by user's accessible properties.
         """
         user = self.request.user
-        queryset = (
-            Inventory.objects.select_related('property', 'room', 'created_by')
-            .prefetch_related(
-                'jobs__user',
-                'preventive_maintenances__assigned_to',
-                'preventive_maintenances__created_by'
+        if self.action == 'list':
+            # InventoryListSerializer only reads these columns (and the user
+            # ids) from related rows; to_attr hands it plain lists to slice
+            related = (
+                Prefetch('jobs', queryset=Job.objects.only(
+                    'id', 'job_id', 'description', 'status', 'user', 'created_at', 'updated_at',
+                ), to_attr='prefetched_jobs'),
+                # PreventiveMaintenance.__init__ reads the image fields, so they stay loaded
+                Prefetch('preventive_maintenances', queryset=PreventiveMaintenance.objects.only(
+                    'id', 'pm_id', 'pmtitle', 'status', 'assigned_to', 'created_by',
+                    'scheduled_date', 'updated_at', 'before_image', 'after_image',
+                ), to_attr='prefetched_preventive_maintenances'),
+            )
+        else:
+            # InventorySerializer renders user display names (via userprofile)
+            # for every related row and nests usage_records with their FKs;
+            # the usage rows' inventory back-reference is set by the prefetch
+            related = (
+                Prefetch('jobs', queryset=Job.objects.select_related('user__userprofile')),
+                Prefetch('preventive_maintenances', queryset=PreventiveMaintenance.objects.select_related(
+                    'assigned_to__userprofile', 'created_by__userprofile',
+                )),
+                Prefetch('usage_records', queryset=InventoryUsage.objects.select_related(
+                    'job', 'preventive_maintenance', 'property', 'consumed_by__userprofile',
+                )),
             )
+        queryset = (
+            Inventory.objects.select_related('property', 'room', 'created_by__userprofile')
+            .prefetch_related(*related)
             .all()
         )
         
@@ -5704,7 +5747,6 @@ class InventoryViewSet(viewsets.ModelViewSet):
         obj = queryset.filter(item_id__iexact=item_id).first()
         
         if obj is None:
-            from django.http import Http404
             raise Http404(f"No Inventory matches the given query with item_id: {item_id}")
         
         self.check_object_permissions(self.request, obj)
@@ -5845,7 +5887,6 @@ class InventoryViewSet(viewsets.ModelViewSet):
             
             # Link to job or PM if provided
             if job_id:
-                from .models import Job
                 try:
                     job = Job.objects.get(job_id=job_id, user=request.user)
                     inventory.jobs.add(job)
@@ -5856,7 +5897,6 @@ class InventoryViewSet(viewsets.ModelViewSet):
                     )
             
             if pm_id:
-                from .models import PreventiveMaintenance
                 pm = PreventiveMaintenance.objects.filter(
                     pm_id=pm_id
                 ).filter(